@@ -4,6 +4,7 @@ Usage:
     python download_charmorph.py                  # Extract ALL characters, activate mb_male
     python download_charmorph.py --switch mb_female   # Switch active character (from cache)
     python download_charmorph.py --list               # List cached characters
+    python download_charmorph.py --force              # Re-extract even if cache is current
 
 Extracts character data from the last CharMorphPlugin git commit (69e914e)
 into charmorph_data/{name}/ and copies the active character to data/humanBody/
@@ -16,13 +17,15 @@ Characters:
 
     reom is skipped (no faces.npy -> cannot render).
 """
+import hashlib
 import json
 import os
 import shutil
 import sys
 import tarfile
-import tempfile
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -31,15 +34,77 @@ DEST = Path(__file__).resolve().parent
 CHARMORPH_COMMIT = '69e914e'
 
 # Characters with faces.npy (renderable)
+CHARACTERS_ROOT = 'CharMorphPlugin/data/characters/'
 CHARACTERS = ['mb_male', 'mb_female', 'antonia']
 DEFAULT_CHARACTER = 'mb_male'
 
+# Character files relevant for humanbody_core (relative to the character dir)
+EXTRACT_PREFIXES = ('morphs/', 'weights/', 'joints/')
+EXTRACT_EXACT = frozenset({
+    'faces.npy', 'config.yaml', 'morphs_meta.yaml', 'morphs_meta_fantasy.yaml',
+})
+
 # Cache directory for all extracted characters
 CACHE_DIR = DEST / 'charmorph_data'
 
 # Active character data directory (read by test_character_api.py)
 ACTIVE_DIR = DEST / 'data' / 'humanBody'
 
+# Minimal settings.yaml written next to humanbody_core
+SETTINGS_YAML = (
+    b'character_defaults:\n'
+    b'  gender:\n'
+    b'    min: 0\n'
+    b'    max: 100\n'
+    b'    default: 0\n'
+    b'  age:\n'
+    b'    min: 18\n'
+    b'    max: 100\n'
+    b'    default: 59\n'
+    b'  mass:\n'
+    b'    min: 45\n'
+    b'    max: 200\n'
+    b'    default: 123\n'
+    b'  tone:\n'
+    b'    min: 0\n'
+    b'    max: 100\n'
+    b'    default: 50\n'
+    b'  height:\n'
+    b'    min: 150\n'
+    b'    max: 200\n'
+    b'    default: 175\n'
+)
+
+# Parsed commit_info.json (see _load_info / _save_info)
+_info_cache = None
+
+# Pipe buffer between `git archive` and the tar parser
+PIPE_BUFSIZE = 1 << 20
+# Block size for copying member payloads to disk (tarfile default is 16 KiB)
+COPY_BUFSIZE = 1 << 20
+# Raw `git archive` output reused across runs (commits are immutable)
+ARCHIVE_CACHE = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'charmorph'
+
+
+def _load_info():
+    """Return commit_info.json contents (cached after the first read), or None."""
+    global _info_cache
+    if _info_cache is None:
+        info_path = DEST / 'commit_info.json'
+        if not info_path.exists():
+            return None
+        with open(info_path, 'r', encoding='utf-8') as f:
+            _info_cache = json.load(f)
+    return _info_cache
+
+
+def _save_info(info):
+    """Write commit_info.json and keep it as the cached copy."""
+    global _info_cache
+    with open(DEST / 'commit_info.json', 'w', encoding='utf-8') as f:
+        json.dump(info, f, indent=2, ensure_ascii=False)
+    _info_cache = info
+
 
 def clean_active():
     """Remove active character data (data/humanBody/)."""
@@ -50,81 +115,157 @@ def clean_active():
 
 def clean_all():
     """Remove all extracted files, keeping scripts and reference code."""
+    global _info_cache
+    _info_cache = None
     keep = {
         'download_version.py', 'download_charmorph.py',
         '__init__.py', '__pycache__', '.gitignore',
         'charmorph_ref',
     }
-    for entry in DEST.iterdir():
-        if entry.name in keep:
-            continue
-        if entry.is_dir():
-            shutil.rmtree(entry)
-        else:
-            entry.unlink()
+    with os.scandir(DEST) as it:
+        for entry in it:
+            if entry.name in keep:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
 
 
-def extract_character(name):
-    """Extract one character from git into charmorph_data/{name}/."""
-    char_prefix = f'CharMorphPlugin/data/characters/{name}/'
-    cache_path = CACHE_DIR / name
+class _TeeReader:
+    """Read-only file wrapper that copies every chunk read into ``sink``."""
 
-    if cache_path.exists():
-        shutil.rmtree(cache_path)
-    cache_path.mkdir(parents=True, exist_ok=True)
+    def __init__(self, src, sink):
+        self._src = src
+        self._sink = sink
+
+    def read(self, size=-1):
+        data = self._src.read(size)
+        self._sink.write(data)
+        return data
 
-    with tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as tmp:
-        tmp_path = tmp.name
-    try:
-        subprocess.run(
-            ['git', '-C', str(PARENT_REPO), 'archive', '--format=tar',
-             '-o', tmp_path, CHARMORPH_COMMIT, char_prefix],
-            check=True,
-        )
-
-        with tarfile.open(tmp_path, 'r') as tar:
-            for member in tar.getmembers():
-                if not member.name.startswith(char_prefix):
-                    continue
-                rel = member.name[len(char_prefix):]
-                if not rel:
-                    continue
-
-                # Only extract data files relevant for humanbody_core
-                should_extract = False
-                if rel.startswith('morphs/'):
-                    should_extract = True
-                elif rel in ('faces.npy', 'config.yaml', 'morphs_meta.yaml',
-                             'morphs_meta_fantasy.yaml'):
-                    should_extract = True
-                elif rel.startswith('weights/'):
-                    should_extract = True
-                elif rel.startswith('joints/'):
-                    should_extract = True
-
-                if not should_extract:
-                    continue
-
-                dest_path = cache_path / rel
-                if member.isdir():
-                    dest_path.mkdir(parents=True, exist_ok=True)
-                else:
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    with tar.extractfile(member) as src:
-                        with open(dest_path, 'wb') as dst:
-                            dst.write(src.read())
-                    print(f'  {name}/{rel}')
 
+def _open_tar_stream(fileobj):
+    # bufsize makes tarfile pull from the pipe/file in 1 MiB blocks
+    # instead of its 10 KiB default
+    return tarfile.open(fileobj=fileobj, mode='r|', bufsize=PIPE_BUFSIZE,
+                        copybufsize=COPY_BUFSIZE)
+
+
+@contextmanager
+def _archive_stream(repo, commit, *paths):
+    """Stream ``git archive`` straight into a tarfile (no temp file).
+
+    The archive is read in streaming mode ('r|'), so members must be
+    consumed in order while git is still producing the rest of the tar.
+    The raw tar is kept in ARCHIVE_CACHE keyed by commit, repo and paths;
+    later runs replay it from disk without calling git. ``commit`` must
+    therefore be a hash, not a branch name.
+    """
+    key = hashlib.sha1('\0'.join([str(repo), commit, *paths]).encode()).hexdigest()
+    cached = ARCHIVE_CACHE / f'{commit}-{key[:12]}.tar'
+    if cached.is_file():
+        with open(cached, 'rb') as f, _open_tar_stream(f) as tar:
+            yield tar
+        return
+
+    ARCHIVE_CACHE.mkdir(parents=True, exist_ok=True)
+    partial = cached.with_suffix('.part')
+    cmd = ['git', '-C', str(repo), 'archive', '--format=tar', commit, *paths]
+    # Popen(bufsize=...) gives stdout a 1 MiB BufferedReader
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=PIPE_BUFSIZE)
+    complete = False
+    try:
+        with open(partial, 'wb') as sink:
+            reader = _TeeReader(proc.stdout, sink)
+            with _open_tar_stream(reader) as tar:
+                yield tar
+            # Drain the end-of-archive padding so git can exit cleanly
+            # and the cached copy is the complete tar
+            while reader.read(PIPE_BUFSIZE):
+                pass
+        complete = True
+    except tarfile.ReadError:
+        # An empty/truncated stream usually means git itself failed
+        proc.stdout.close()
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd) from None
+        raise
     finally:
-        os.unlink(tmp_path)
+        proc.stdout.close()
+        proc.wait()
+        if not (complete and proc.returncode == 0):
+            partial.unlink(missing_ok=True)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    os.replace(partial, cached)
+
+
+def extract_characters(names):
+    """Extract characters from git into charmorph_data/{name}/.
 
-    # Verify
+    All characters come from a single ``git archive`` call; members are
+    dispatched to their cache directory by the character folder name.
+    """
+    wanted = set(names)
+    for name in names:
+        cache_path = CACHE_DIR / name
+        if cache_path.exists():
+            shutil.rmtree(cache_path)
+        cache_path.mkdir(parents=True, exist_ok=True)
+
+    prefixes = [f'{CHARACTERS_ROOT}{name}/' for name in names]
+    cache_root = str(CACHE_DIR)
+    created_dirs = set()
+    with _archive_stream(PARENT_REPO, CHARMORPH_COMMIT, *prefixes) as tar:
+        for member in tar:
+            if not member.name.startswith(CHARACTERS_ROOT):
+                continue
+            name, _, rel = member.name[len(CHARACTERS_ROOT):].partition('/')
+            if name not in wanted or not rel:
+                continue
+
+            # Only extract data files relevant for humanbody_core
+            if not (rel.startswith(EXTRACT_PREFIXES) or rel in EXTRACT_EXACT):
+                continue
+
+            # Plain strings: no Path objects on the per-member hot path
+            dest_path = os.path.join(cache_root, name, rel)
+            dest_dir = dest_path if member.isdir() else os.path.dirname(dest_path)
+            if dest_dir not in created_dirs:
+                os.makedirs(dest_dir, exist_ok=True)
+                created_dirs.add(dest_dir)
+            if not member.isdir():
+                with tar.extractfile(member) as src, \
+                        open(dest_path, 'wb', buffering=COPY_BUFSIZE) as dst:
+                    shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+                print(f'  {name}/{rel}')
+
+    for name in names:
+        verify_character(name)
+
+
+def _npy_shape(path):
+    """Read an array shape from the .npy header without loading the payload."""
+    from numpy.lib import format as npy_format
+    with open(path, 'rb') as f:
+        version = npy_format.read_magic(f)
+        if version == (1, 0):
+            shape, _fortran, _dtype = npy_format.read_array_header_1_0(f)
+        else:
+            shape, _fortran, _dtype = npy_format.read_array_header_2_0(f)
+    return shape
+
+
+def verify_character(name):
+    """Print a short summary of an extracted character."""
+    cache_path = CACHE_DIR / name
     faces = cache_path / 'faces.npy'
     l1_dir = cache_path / 'morphs' / 'L1'
+    print(f'\n{name}:')
     if faces.exists():
-        import numpy as np
-        arr = np.load(str(faces))
-        print(f'  -> faces.npy: {arr.shape[0]} faces, shape={arr.shape}')
+        shape = _npy_shape(faces)
+        print(f'  -> faces.npy: {shape[0]} faces, shape={shape}')
     else:
         print(f'  -> WARNING: no faces.npy!')
 
@@ -133,8 +274,16 @@ def extract_character(name):
         print(f'  -> L1 body types: {types}')
 
 
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a full copy (e.g. across drives)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def activate_character(name):
-    """Copy character data from cache to active directory (data/humanBody/)."""
+    """Link character data from cache into the active directory (data/humanBody/)."""
     cache_path = CACHE_DIR / name
     if not cache_path.exists():
         print(f'ERROR: Character "{name}" not found in cache.')
@@ -144,23 +293,23 @@ def activate_character(name):
     print(f'Activating character: {name}')
     clean_active()
 
-    # Copy all data files
-    for src_path in cache_path.rglob('*'):
-        if src_path.is_file():
-            rel = src_path.relative_to(cache_path)
-            dst_path = ACTIVE_DIR / rel
-            dst_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_path, dst_path)
+    # Link all data files (the cache stays the single copy on disk)
+    srcs, dsts = [], []
+    for root, _dirs, files in os.walk(cache_path):
+        dst_dir = os.path.join(ACTIVE_DIR, os.path.relpath(root, cache_path))
+        os.makedirs(dst_dir, exist_ok=True)
+        for fname in files:
+            srcs.append(os.path.join(root, fname))
+            dsts.append(os.path.join(dst_dir, fname))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_link_or_copy, srcs, dsts))
 
     # Update commit_info.json with active character
-    info_path = DEST / 'commit_info.json'
-    if info_path.exists():
-        with open(info_path, 'r', encoding='utf-8') as f:
-            info = json.load(f)
+    info = _load_info()
+    if info is not None and info.get('character') != name:
         info['character'] = name
         info['message'] = f'CharMorphPlugin {name} character'
-        with open(info_path, 'w', encoding='utf-8') as f:
-            json.dump(info, f, indent=2, ensure_ascii=False)
+        _save_info(info)
 
     print(f'  -> {name} is now the active character')
     return True
@@ -170,8 +319,18 @@ def list_cached():
     """Return list of cached character names."""
     if not CACHE_DIR.exists():
         return []
-    return sorted(d.name for d in CACHE_DIR.iterdir()
-                  if d.is_dir() and (d / 'faces.npy').exists())
+    with os.scandir(CACHE_DIR) as it:
+        return sorted(d.name for d in it
+                      if d.is_dir() and os.path.exists(os.path.join(d.path, 'faces.npy')))
+
+
+def is_cache_current():
+    """True if the cache already holds every character from CHARMORPH_COMMIT."""
+    info = _load_info()
+    if info is None or not (DEST / 'humanbody_core').is_dir():
+        return False
+    return (info.get('full_hash') == CHARMORPH_COMMIT
+            and set(list_cached()) >= set(CHARACTERS))
 
 
 def extract_humanbody_core():
@@ -181,51 +340,18 @@ def extract_humanbody_core():
     v0.53 (b884619) which has a compatible MorphData that can load CharMorphPlugin data.
     """
     CORE_COMMIT = 'b884619'  # v0.53
-    with tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as tmp:
-        tmp_path = tmp.name
-    try:
-        subprocess.run(
-            ['git', '-C', str(PARENT_REPO), 'archive', '--format=tar',
-             '-o', tmp_path, CORE_COMMIT, 'humanbody_core/'],
-            check=True,
-        )
-        with tarfile.open(tmp_path, 'r') as tar:
-            for member in tar.getmembers():
-                if member.name.startswith('humanbody_core/'):
-                    tar.extract(member, path=str(DEST))
-                    if not member.isdir():
-                        print(f'  {member.name}')
-    finally:
-        os.unlink(tmp_path)
+    with _archive_stream(PARENT_REPO, CORE_COMMIT, 'humanbody_core/') as tar:
+        for member in tar:
+            if member.name.startswith('humanbody_core/'):
+                # Throwaway copy: skip chmod/utime and owner name lookups
+                tar.extract(member, path=str(DEST), set_attrs=False, numeric_owner=True)
+                if not member.isdir():
+                    print(f'  {member.name}')
 
 
 def create_settings_yaml():
     """Create a minimal settings.yaml."""
-    settings = DEST / 'settings.yaml'
-    settings.write_text(
-        'character_defaults:\n'
-        '  gender:\n'
-        '    min: 0\n'
-        '    max: 100\n'
-        '    default: 0\n'
-        '  age:\n'
-        '    min: 18\n'
-        '    max: 100\n'
-        '    default: 59\n'
-        '  mass:\n'
-        '    min: 45\n'
-        '    max: 200\n'
-        '    default: 123\n'
-        '  tone:\n'
-        '    min: 0\n'
-        '    max: 100\n'
-        '    default: 50\n'
-        '  height:\n'
-        '    min: 150\n'
-        '    max: 200\n'
-        '    default: 175\n',
-        encoding='utf-8',
-    )
+    (DEST / 'settings.yaml').write_bytes(SETTINGS_YAML)
 
 
 def main():
@@ -237,10 +363,8 @@ def main():
         if cached:
             print(f'Cached characters: {cached}')
             # Check which is active
-            info_path = DEST / 'commit_info.json'
-            if info_path.exists():
-                with open(info_path, 'r', encoding='utf-8') as f:
-                    info = json.load(f)
+            info = _load_info()
+            if info is not None:
                 print(f'Active: {info.get("character", "unknown")}')
         else:
             print('No characters cached. Run without arguments to extract all.')
@@ -259,6 +383,13 @@ def main():
             print('Call /api/character-test/reload/ to refresh the test page.')
         return
 
+    # Same commit already extracted: only re-activate the default character
+    if '--force' not in args and is_cache_current():
+        print(f'Cache is up to date with commit {CHARMORPH_COMMIT} (use --force to re-extract).')
+        activate_character(DEFAULT_CHARACTER)
+        print('\nDone!')
+        return
+
     # Default: extract ALL characters + humanbody_core
     print(f'Extracting CharMorphPlugin characters from commit {CHARMORPH_COMMIT}...')
     print(f'Characters: {CHARACTERS}')
@@ -268,12 +399,13 @@ def main():
 
     # Extract each character into cache
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    for name in CHARACTERS:
-        print(f'\nExtracting {name}...')
-        extract_character(name)
-
-    print('\nExtracting humanbody_core module (v0.53)...')
-    extract_humanbody_core()
+    print(f'\nExtracting {", ".join(CHARACTERS)} and humanbody_core module (v0.53)...')
+    # Independent archives: run git + tar parsing for both on separate cores
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        jobs = [pool.submit(extract_characters, CHARACTERS),
+                pool.submit(extract_humanbody_core)]
+        for job in jobs:
+            job.result()
 
     print('\nCreating settings.yaml...')
     create_settings_yaml()
@@ -290,9 +422,7 @@ def main():
         'character': DEFAULT_CHARACTER,
         'available_characters': CHARACTERS,
     }
-    info_path = DEST / 'commit_info.json'
-    with open(info_path, 'w', encoding='utf-8') as f:
-        json.dump(info, f, indent=2, ensure_ascii=False)
+    _save_info(info)
 
     # Activate default character
     print(f'\nActivating default character: {DEFAULT_CHARACTER}')
@@ -3,8 +3,9 @@
 Usage:
     python download_version.py <commit_hash>
 
-Extracts humanbody_core/ and data/ from the specified commit using
-``git archive`` so the test character page can load an isolated version.
+Extracts humanbody_core/ and data/ from the specified commit (``git ls-tree``
++ ``git cat-file --batch``) so the test character page can load an isolated
+version.
 
 Supports two repo layouts:
   - New (>= 83e40b6): humanbody_core/ lives inside the HumanBody repo
@@ -17,8 +18,7 @@ import re
 import shutil
 import subprocess
 import sys
-import tarfile
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -27,6 +27,12 @@ PARENT_REPO = Path(r'A:\3DTools')            # The root monorepo
 HUMANBODY_REPO = PARENT_REPO / 'HumanBody'   # Subdir (has its own git identity via prefix)
 # Destination (same dir as this script)
 DEST = Path(__file__).resolve().parent
+# Pipe buffer for `git cat-file --batch` output
+PIPE_BUFSIZE = 1 << 20
+# Block size for copying blob payloads to disk
+COPY_BUFSIZE = 1 << 20
+# Parallel git cat-file processes / copy threads
+WORKERS = min(8, os.cpu_count() or 1)
 
 # Paths to extract from the HumanBody repo (new layout)
 EXTRACT_PREFIXES_NEW = [
@@ -49,7 +55,7 @@ EXTRACT_PREFIXES_NEW = [
 # Paths to extract from the parent repo (old layout)
 # humanbody_core/ is at the root, data is under HumanBody/data/
 EXTRACT_MAP_OLD = {
-    # source prefix in archive -> dest prefix in TestCharakter
+    # source prefix in the parent repo -> dest prefix in TestCharakter
     'humanbody_core/': 'humanbody_core/',
     'HumanBody/data/humanBody/morphs/': 'data/humanBody/morphs/',
     'HumanBody/data/humanBody/faces.npy': 'data/humanBody/faces.npy',
@@ -65,6 +71,13 @@ EXTRACT_MAP_OLD = {
     'HumanBody/data/humanBody/normals.npy': 'data/humanBody/normals.npy',
     'HumanBody/settings.yaml': 'settings.yaml',
 }
+# New-layout filter: exact names plus a tuple for a single C-level startswith()
+_NEW_EXACT = frozenset(p.rstrip('/') for p in EXTRACT_PREFIXES_NEW)
+_NEW_PREFIXES = tuple(EXTRACT_PREFIXES_NEW)
+# Cheap C-level reject for unrelated paths (also matches the slash-less exact entries)
+_OLD_GATE = tuple(p.rstrip('/') for p in EXTRACT_MAP_OLD)
+# Longest source prefix first, so a nested prefix wins over its parent
+_OLD_SORTED = sorted(EXTRACT_MAP_OLD.items(), key=lambda kv: -len(kv[0]))
 
 # Files that are typically untracked (Blender-exported) but needed at runtime.
 FALLBACK_FILES = [
@@ -85,13 +98,19 @@ FALLBACK_FILES = [
 def clean_dest():
     """Remove old extracted files, keeping scripts and gitignore."""
     keep = {'download_version.py', '__init__.py', '__pycache__', '.gitignore'}
-    for entry in DEST.iterdir():
-        if entry.name in keep:
-            continue
-        if entry.is_dir():
-            shutil.rmtree(entry)
-        else:
-            entry.unlink()
+    dirs = []
+    with os.scandir(DEST) as it:
+        for entry in it:
+            if entry.name in keep:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.path)
+            else:
+                os.unlink(entry.path)
+    # Separate subtrees are independent, so remove them in parallel
+    if dirs:
+        with ThreadPoolExecutor(max_workers=min(4, len(dirs))) as pool:
+            list(pool.map(shutil.rmtree, dirs))
 
 
 def _parse_version(message: str) -> str:
@@ -100,14 +119,12 @@ def _parse_version(message: str) -> str:
     return m.group(1) if m else ''
 
 
-def get_commit_info(commit_hash: str, repo: Path) -> dict:
-    """Get commit metadata via git log."""
-    fmt = '%H%n%h%n%s%n%ai'
-    result = subprocess.run(
-        ['git', '-C', str(repo), 'log', '-1', f'--format={fmt}', commit_hash],
-        capture_output=True, text=True, check=True,
-    )
-    lines = result.stdout.strip().split('\n')
+COMMIT_FORMAT = '%H%n%h%n%s%n%ai'
+
+
+def _parse_commit_info(stdout: str) -> dict:
+    """Build the commit_info dict from ``COMMIT_FORMAT`` output."""
+    lines = stdout.strip().split('\n')
     message = lines[2]
     return {
         'full_hash': lines[0],
@@ -119,85 +136,154 @@ def get_commit_info(commit_hash: str, repo: Path) -> dict:
     }
 
 
-def _has_path_in_commit(repo: Path, commit: str, path: str) -> bool:
-    """Check if a path exists in a git commit."""
-    r = subprocess.run(
-        ['git', '-C', str(repo), 'ls-tree', '--name-only', commit, path],
-        capture_output=True, text=True,
+def get_commit_info(commit_hash: str, repo: Path) -> dict:
+    """Get commit metadata via git log."""
+    result = subprocess.run(
+        ['git', '-C', str(repo), 'log', '-1', f'--format={COMMIT_FORMAT}', commit_hash],
+        capture_output=True, text=True, check=True,
     )
-    return path.rstrip('/') in r.stdout
+    return _parse_commit_info(result.stdout)
 
 
-def detect_layout(commit_hash: str) -> str:
+def resolve_commit(commit_hash: str):
     """Detect whether humanbody_core is in HumanBody repo or parent repo.
 
-    Returns 'new' if humanbody_core/ is in the HumanBody repo,
-    'old' if it's in the parent repo (A:\\3DTools), or 'none'.
+    Returns ``(layout, info)``: layout is 'new' if humanbody_core/ is in the
+    HumanBody repo, 'old' if it's in the parent repo (A:\\3DTools), or 'none'
+    (with info None). A single ``git show`` per repo both checks that
+    ``<commit>:./humanbody_core`` exists (relative to ``-C``, like
+    ``ls-tree``) and prints the commit metadata.
     """
-    # Check HumanBody repo first (new layout)
-    if _has_path_in_commit(HUMANBODY_REPO, commit_hash, 'humanbody_core/'):
-        return 'new'
+    # Check HumanBody repo first (new layout), then the parent repo
+    # (old layout: humanbody_core/ at root alongside HumanBody/)
+    for layout, repo in (('new', HUMANBODY_REPO), ('old', PARENT_REPO)):
+        r = subprocess.run(
+            ['git', '-C', str(repo), 'show', '-s', f'--format={COMMIT_FORMAT}',
+             commit_hash, f'{commit_hash}:./humanbody_core'],
+            capture_output=True, text=True,
+        )
+        if r.returncode == 0:
+            # Output continues with the humanbody_core tree listing; only the
+            # first four lines belong to the commit
+            return layout, _parse_commit_info('\n'.join(r.stdout.split('\n')[:4]))
+    return 'none', None
 
-    # Check parent repo (old layout: humanbody_core/ at root alongside HumanBody/)
-    if _has_path_in_commit(PARENT_REPO, commit_hash, 'humanbody_core/'):
-        return 'old'
 
-    return 'none'
+def _list_blobs(repo: Path, commit: str, paths) -> list:
+    """Return ``(oid, path)`` for every file under ``paths`` in ``commit``.
 
+    One recursive ``git ls-tree`` lists only the requested subtrees; paths
+    missing from the commit (e.g. untracked data files) are simply absent.
+    """
+    r = subprocess.run(
+        ['git', '-C', str(repo), 'ls-tree', '-r', '-z', commit, '--',
+         *(p.rstrip('/') for p in paths)],
+        capture_output=True, check=True,
+    )
+    blobs = []
+    for entry in r.stdout.split(b'\0'):
+        if not entry:
+            continue
+        meta, path = entry.split(b'\t', 1)
+        _mode, obj_type, oid = meta.split()
+        if obj_type == b'blob':  # skip submodule entries
+            blobs.append((oid.decode('ascii'), os.fsdecode(path)))
+    return blobs
 
-def extract_new(commit_hash: str):
-    """Extract from HumanBody repo (new layout: humanbody_core inside repo)."""
-    with tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as tmp:
-        tmp_path = tmp.name
+
+def _write_blobs(repo: Path, items):
+    """Write blobs using up to WORKERS ``git cat-file --batch`` processes.
+
+    Each worker thread owns its own git process and a round-robin share of
+    ``items``; destinations are distinct files, so no locking is needed.
+    """
+    workers = min(WORKERS, len(items))
+    if workers <= 1:
+        _write_blob_batch(repo, items)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        batches = [items[i::workers] for i in range(workers)]
+        list(pool.map(_write_blob_batch, [repo] * workers, batches))
+
+
+def _write_blob_batch(repo: Path, items):
+    """Stream blobs into files through one persistent ``git cat-file --batch``.
+
+    ``items`` is a list of ``(oid, dest_path)``; parent directories must
+    already exist. Each request is answered with ``<oid> blob <size>\\n``,
+    the raw content and a trailing newline.
+    """
+    cmd = ['git', '-C', str(repo), 'cat-file', '--batch']
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            bufsize=PIPE_BUFSIZE)
     try:
-        subprocess.run(
-            ['git', '-C', str(HUMANBODY_REPO), 'archive', '--format=tar',
-             '-o', tmp_path, commit_hash],
-            check=True,
-        )
-        with tarfile.open(tmp_path, 'r') as tar:
-            for member in tar.getmembers():
-                if any(member.name == p.rstrip('/') or member.name.startswith(p)
-                       for p in EXTRACT_PREFIXES_NEW):
-                    tar.extract(member, path=str(DEST))
+        for oid, dest_path in items:
+            proc.stdin.write(f'{oid}\n'.encode('ascii'))
+            proc.stdin.flush()
+            header = proc.stdout.readline().split()
+            if len(header) != 3 or header[1] != b'blob':
+                raise RuntimeError(f'git cat-file: unexpected reply {header!r} for {oid}')
+            remaining = int(header[2])
+            with open(dest_path, 'wb', buffering=0) as dst:
+                while remaining:
+                    chunk = proc.stdout.read(min(remaining, COPY_BUFSIZE))
+                    if not chunk:
+                        raise EOFError(f'git cat-file: truncated blob {oid}')
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+            proc.stdout.read(1)  # trailing newline
     finally:
-        os.unlink(tmp_path)
+        proc.stdin.close()
+        proc.stdout.close()
+        proc.wait()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def _prepare_dest(dest_path: str, created_dirs: set):
+    """Create the parent directory of ``dest_path`` once per run."""
+    dest_dir = os.path.dirname(dest_path)
+    if dest_dir not in created_dirs:
+        os.makedirs(dest_dir, exist_ok=True)
+        created_dirs.add(dest_dir)
+
+
+def extract_new(commit_hash: str):
+    """Extract from HumanBody repo (new layout: humanbody_core inside repo)."""
+    created_dirs = set()
+    items = []
+    # ls-tree already limits the listing; the name filter stays as a safety net
+    for oid, path in _list_blobs(HUMANBODY_REPO, commit_hash, EXTRACT_PREFIXES_NEW):
+        if path in _NEW_EXACT or path.startswith(_NEW_PREFIXES):
+            dest_path = os.path.join(str(DEST), path)
+            _prepare_dest(dest_path, created_dirs)
+            items.append((oid, dest_path))
+    _write_blobs(HUMANBODY_REPO, items)
 
 
 def extract_old(commit_hash: str):
     """Extract from parent repo (old layout: humanbody_core at root, data under HumanBody/)."""
-    with tempfile.NamedTemporaryFile(suffix='.tar', delete=False) as tmp:
-        tmp_path = tmp.name
-    try:
-        subprocess.run(
-            ['git', '-C', str(PARENT_REPO), 'archive', '--format=tar',
-             '-o', tmp_path, commit_hash],
-            check=True,
-        )
-        with tarfile.open(tmp_path, 'r') as tar:
-            for member in tar.getmembers():
-                for src_prefix, dest_prefix in EXTRACT_MAP_OLD.items():
-                    if member.name == src_prefix.rstrip('/') or member.name.startswith(src_prefix):
-                        # Rewrite path: HumanBody/data/... -> data/...
-                        rel = member.name[len(src_prefix):]
-                        dest_path = os.path.join(str(DEST), dest_prefix.rstrip('/'),
-                                                 rel) if rel else os.path.join(
-                                                     str(DEST), dest_prefix.rstrip('/'))
-                        if member.isdir():
-                            os.makedirs(dest_path, exist_ok=True)
-                        else:
-                            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                            with tar.extractfile(member) as src:
-                                with open(dest_path, 'wb') as dst:
-                                    dst.write(src.read())
-                        break
-    finally:
-        os.unlink(tmp_path)
+    created_dirs = set()
+    items = []
+    for oid, path in _list_blobs(PARENT_REPO, commit_hash, EXTRACT_MAP_OLD):
+        if not path.startswith(_OLD_GATE):
+            continue
+        for src_prefix, dest_prefix in _OLD_SORTED:
+            if path == src_prefix.rstrip('/') or path.startswith(src_prefix):
+                # Rewrite path: HumanBody/data/... -> data/...
+                rel = path[len(src_prefix):]
+                dest_path = os.path.join(str(DEST), dest_prefix.rstrip('/'),
+                                         rel) if rel else os.path.join(
+                                             str(DEST), dest_prefix.rstrip('/'))
+                _prepare_dest(dest_path, created_dirs)
+                items.append((oid, dest_path))
+                break
+    _write_blobs(PARENT_REPO, items)
 
 
 def copy_fallback_files():
     """Copy untracked data files from the live HumanBody repo if missing."""
-    copied = []
+    copied, srcs, dsts = [], [], []
     for rel_path in FALLBACK_FILES:
         dest_file = DEST / rel_path
         if dest_file.exists():
@@ -205,8 +291,12 @@ def copy_fallback_files():
         src_file = HUMANBODY_REPO / rel_path
         if src_file.exists():
             dest_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(str(src_file), str(dest_file))
+            srcs.append(str(src_file))
+            dsts.append(str(dest_file))
             copied.append(rel_path)
+    if srcs:
+        with ThreadPoolExecutor(max_workers=min(WORKERS, len(srcs))) as pool:
+            list(pool.map(shutil.copy2, srcs, dsts))
     return copied
 
 
@@ -218,14 +308,12 @@ def main():
     commit_hash = sys.argv[1]
     print(f'Resolving commit {commit_hash}...')
 
-    # Detect layout
-    layout = detect_layout(commit_hash)
+    # Detect layout (and read commit metadata in the same git call)
+    layout, info = resolve_commit(commit_hash)
 
     if layout == 'new':
-        repo = HUMANBODY_REPO
         print(f'  Layout: new (humanbody_core inside HumanBody repo)')
     elif layout == 'old':
-        repo = PARENT_REPO
         print(f'  Layout: old (humanbody_core in parent repo A:\\3DTools)')
     else:
         # Try to get info for error message
@@ -242,7 +330,6 @@ def main():
         print('Neither in the HumanBody repo nor in the parent repo.')
         sys.exit(1)
 
-    info = get_commit_info(commit_hash, repo)
     print(f'  Commit: {info["short_hash"]} — {info["message"]}')
     print(f'  Date:   {info["date"]}')
     if info['version']:
@@ -253,11 +340,11 @@ def main():
     clean_dest()
 
     # Extract
-    print('Extracting from git archive...')
+    print('Extracting from git...')
     if layout == 'new':
-        extract_new(commit_hash)
+        extract_new(info['full_hash'])
     else:
-        extract_old(commit_hash)
+        extract_old(info['full_hash'])
 
     # Copy untracked data files as fallback
     copied = copy_fallback_files()
@@ -19,11 +19,15 @@ class CoreConfig(AppConfig):
 
         import os
         import threading
-        import glob
         from pathlib import Path
         from django.conf import settings as django_settings
         from core.models import BVHJob
 
+        # Precompute morph list and CC-propagated skin weights in the background so
+        # the first viewer request doesn't pay for it (skip the autoreloader's parent)
+        if os.environ.get('RUN_MAIN') == 'true' or '--noreload' in sys.argv:
+            threading.Thread(target=self._warm_caches, daemon=True).start()
+
         running_statuses = [
             'detecting_2d', 'openpose', 'openpose_csv', 'mediapipe',
             'lifting_3d', 'mocapnet', 'v4_processing', 'processing',
@@ -32,34 +36,37 @@ class CoreConfig(AppConfig):
         if not orphaned:
             return
 
+        from django.utils import timezone
         from core.views import _is_pid_alive, remonitor_smpl_job
 
+        # Collected per outcome and written in bulk after the loop
+        now = timezone.now()
+        complete_jobs, failed_ids, stale_pid_files = [], [], []
+
         for job in orphaned:
             output_dir = Path(django_settings.MEDIA_ROOT) / 'output' / str(job.id)
             pid_file = output_dir / 'pipeline.pid'
 
             # 1. Check if BVH already exists (subprocess finished during restart)
-            bvh_files = glob.glob(str(output_dir / '*.bvh'))
-            valid_bvh = [f for f in bvh_files if os.path.getsize(f) > 100]
+            try:
+                with os.scandir(output_dir) as it:
+                    valid_bvh = [e.path for e in it
+                                 if e.name.endswith('.bvh') and e.stat().st_size > 100]
+            except FileNotFoundError:
+                valid_bvh = []
             if valid_bvh:
                 job.bvh_file = valid_bvh[0]
                 job.status = 'complete'
                 job.progress = 100
                 job.progress_detail = 'Complete (recovered after restart)'
                 job.error_message = ''
-                try:
-                    import cv2
+                job.updated_at = now
+                # fps is detected at upload; probe only if that never happened
+                if not job.fps:
                     video_path = Path(django_settings.MEDIA_ROOT) / str(job.video_file)
-                    cap = cv2.VideoCapture(str(video_path))
-                    job.fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-                    cap.release()
-                except Exception:
-                    pass
-                job.save()
-                try:
-                    pid_file.unlink()
-                except (FileNotFoundError, OSError):
-                    pass
+                    job.fps = self._probe_fps(video_path) or 30.0
+                complete_jobs.append(job)
+                stale_pid_files.append(pid_file)
                 print(f'[CoreConfig] Job {job.id}: BVH found, marked complete.')
                 continue
 
@@ -79,7 +86,65 @@ class CoreConfig(AppConfig):
                     pass
 
             # 3. No BVH and no running subprocess → mark failed
-            job.status = 'failed'
-            job.error_message = 'Server was restarted while job was running. Click "Neu starten" to retry.'
-            job.save()
+            failed_ids.append(job.id)
             print(f'[CoreConfig] Job {job.id}: marked as failed.')
+
+        if complete_jobs:
+            BVHJob.objects.bulk_update(complete_jobs, [
+                'bvh_file', 'status', 'progress', 'progress_detail',
+                'error_message', 'fps', 'updated_at',
+            ])
+        if failed_ids:
+            BVHJob.objects.filter(pk__in=failed_ids).update(
+                status='failed',
+                error_message='Server was restarted while job was running. Click "Neu starten" to retry.',
+                updated_at=now,
+            )
+        for pid_file in stale_pid_files:
+            try:
+                pid_file.unlink()
+            except (FileNotFoundError, OSError):
+                pass
+
+    @staticmethod
+    def _probe_fps(video_path):
+        """Read the video stream's frame rate from the container header via ffprobe.
+
+        Returns None if ffprobe is unavailable or the rate can't be parsed.
+        """
+        import subprocess
+        try:
+            result = subprocess.run(
+                ['ffprobe', '-v', '0', '-select_streams', 'v:0',
+                 '-show_entries', 'stream=r_frame_rate', '-of', 'csv=p=0',
+                 str(video_path)],
+                capture_output=True, text=True, timeout=10,
+            )
+            num, _, den = result.stdout.strip().partition('/')
+            fps = float(num) / float(den or 1)
+        except (OSError, subprocess.SubprocessError, ValueError, ZeroDivisionError):
+            return None
+        return fps if fps > 0 else None
+
+    @staticmethod
+    def _warm_caches():
+        """Prebuild the morph list, the CC subdivider with its reference normals,
+        the mesh topology and the skin weight caches (both genders)."""
+        from core.character_api import (_get_base_skin_arrays, _get_cc_subdivider,
+                                        _get_propagated_skin_weights,
+                                        _get_topology_json, _morphs_json)
+        try:
+            _morphs_json('Female_Caucasian')
+        except Exception as e:
+            print(f'[CoreConfig] Morph list warm-up failed: {e}')
+        for gender in ('female', 'male'):
+            try:
+                _get_cc_subdivider(gender)
+                _get_topology_json(gender)
+            except Exception as e:
+                print(f'[CoreConfig] Mesh warm-up ({gender}) failed: {e}')
+            try:
+                _get_propagated_skin_weights(gender)
+                _get_base_skin_arrays(gender)
+            except Exception as e:
+                print(f'[CoreConfig] Skin weight warm-up ({gender}) failed: {e}')
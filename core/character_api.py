@@ -4,15 +4,26 @@ Uses humanbody_core for morphing computations.
 """
 import os
 import re
+import sys
 import json
 import uuid
 import base64
+import struct
+import hashlib
+import functools
+import importlib
+import inspect
+import itertools
 import logging
+import threading
+import collections
+import concurrent.futures
 
 import numpy as np
 from django.shortcuts import render, get_object_or_404
-from django.http import JsonResponse, FileResponse, HttpResponseNotFound
+from django.http import JsonResponse, FileResponse, HttpResponse, HttpResponseNotFound
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.views.decorators.http import require_GET, require_POST
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.clickjacking import xframe_options_sameorigin
@@ -30,6 +41,15 @@ from humanbody_core.cloth import (generate_cloth, TEMPLATE_TYPES,
                                   _push_outside_body,
                                   _laplacian_smooth)
 
+try:
+    import orjson  # optional — much faster for the large JSON payloads
+except ImportError:
+    orjson = None
+try:
+    from pybase64 import b64encode as _b64encode  # optional — SIMD base64 encoder
+except ImportError:
+    from base64 import b64encode as _b64encode
+
 logger = logging.getLogger(__name__)
 
 # Lazy-loaded singletons
@@ -37,6 +57,15 @@ _morph_data = None
 _char_defaults = None
 _mesh_data = {}        # {'female': MeshData, 'male': MeshData}
 _cc_subdivider = {}    # {'female': CC, 'male': CC}
+# The startup warm-up thread (CoreConfig._warm_caches) fills these while
+# requests and WebSocket connects may already ask for them: each getter builds
+# under its lock and publishes the object only once it is fully loaded.
+_morph_data_lock = threading.Lock()
+_char_defaults_lock = threading.Lock()
+_mesh_data_lock = threading.Lock()
+_cc_subdivider_lock = threading.Lock()
+_skin_arrays_lock = threading.Lock()
+_propagated_skin_lock = threading.Lock()
 
 
 def _gender_from_body_type(bt):
@@ -47,16 +76,22 @@ def _gender_from_body_type(bt):
 def _get_morph_data():
     global _morph_data
     if _morph_data is None:
-        _morph_data = MorphData(data_dir=str(settings.HUMANBODY_DATA_DIR))
-        _morph_data.load()
+        with _morph_data_lock:
+            if _morph_data is None:
+                md = MorphData(data_dir=str(settings.HUMANBODY_DATA_DIR))
+                md.load()
+                _morph_data = md
     return _morph_data
 
 
 def _get_char_defaults():
     global _char_defaults
     if _char_defaults is None:
-        _char_defaults = CharacterDefaults()
-        _char_defaults.load(str(settings.HUMANBODY_ROOT / 'settings.yaml'))
+        with _char_defaults_lock:
+            if _char_defaults is None:
+                cd = CharacterDefaults()
+                cd.load(str(settings.HUMANBODY_ROOT / 'settings.yaml'))
+                _char_defaults = cd
     return _char_defaults
 
 
@@ -64,16 +99,143 @@ def _get_mesh_data(gender='female'):
     """Get MeshData for a gender ('female' or 'male')."""
     global _mesh_data
     if gender not in _mesh_data:
-        if gender == 'male':
-            data_dir = str(settings.HUMANBODY_DATA_DIR) + '_male'
-        else:
-            data_dir = str(settings.HUMANBODY_DATA_DIR)
-        md = MeshData(data_dir=data_dir)
-        md.load()
-        _mesh_data[gender] = md
+        with _mesh_data_lock:
+            if gender not in _mesh_data:
+                if gender == 'male':
+                    data_dir = str(settings.HUMANBODY_DATA_DIR) + '_male'
+                else:
+                    data_dir = str(settings.HUMANBODY_DATA_DIR)
+                md = MeshData(data_dir=data_dir)
+                md.load()
+                _mesh_data[gender] = md
     return _mesh_data[gender]
 
 
+def _dumps_json(data):
+    """Serialize ``data`` to JSON bytes (orjson if installed, numpy arrays allowed)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, cls=DjangoJSONEncoder).encode('utf-8')
+
+
+def _fast_json_response(data, status=200):
+    """JsonResponse replacement for large payloads, see _dumps_json."""
+    return HttpResponse(_dumps_json(data), content_type='application/json', status=status)
+
+
+def _b64_array(arr, dtype=None):
+    """Base64 text of an array's raw bytes (optionally cast to ``dtype``).
+
+    Encodes straight from the contiguous buffer — no ``.tobytes()`` copy;
+    ``ascontiguousarray`` only copies when a cast or reorder is needed.
+    """
+    a = np.ascontiguousarray(arr, dtype=dtype)
+    return _b64encode(a.reshape(-1).view(np.uint8)).decode('ascii')
+
+
+# pybase64 releases the GIL while encoding, so independent arrays can be
+# encoded side by side; the stdlib encoder holds it, there we stay serial.
+_B64_PARALLEL = _b64encode.__module__.startswith('pybase64')
+_b64_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix='b64') if _B64_PARALLEL else None
+
+
+def _b64_arrays(*items):
+    """_b64_array for several ``(arr, dtype)`` pairs, concurrently if possible."""
+    if _b64_pool is None or len(items) < 2:
+        return [_b64_array(arr, dtype) for arr, dtype in items]
+    futures = [_b64_pool.submit(_b64_array, arr, dtype) for arr, dtype in items]
+    return [f.result() for f in futures]
+
+
+def _loads_json(raw):
+    """Parse JSON bytes/str (orjson if installed). Invalid input raises the
+    stdlib ``json.JSONDecodeError``, so callers' except clauses stay as they are."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals, which only the stdlib parser accepts
+    return json.loads(raw)
+
+
+def _load_json_file(path):
+    """Parse a JSON file into fresh objects (orjson if installed — several
+    times faster on the multi-MB skin weight files)."""
+    with open(path, 'rb') as f:
+        return _loads_json(f.read())
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path, mtime_ns):
+    """Parse a JSON file once per (path, mtime). The result is shared — don't mutate it."""
+    return _load_json_file(path)
+
+
+@functools.lru_cache(maxsize=32)
+def _json_bytes_cached(path, mtime_ns):
+    """Serialized JSON of a file, ready to send as-is (see _load_json_cached)."""
+    return _dumps_json(_load_json_cached(path, mtime_ns))
+
+
+def _write_json_file(path, data):
+    """Write ``data`` as indented UTF-8 JSON in one write, then swap it in
+    atomically (readers never see a half-written file)."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    tmp_path = f'{path}.{uuid.uuid4().hex[:8]}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _save_upload(upload, dest_path):
+    """Write an UploadedFile to ``dest_path`` without a Python chunk loop.
+
+    Large uploads already spooled to a temp file are hard-linked into place
+    when the temp dir is on the same filesystem (no bytes copied at all),
+    else copied file-to-file (shutil.copyfile uses sendfile/copy_file_range
+    where available); in-memory ones go through copyfileobj with one
+    reusable 1 MiB buffer.
+    """
+    import shutil
+    if hasattr(upload, 'temporary_file_path'):
+        tmp_path = upload.temporary_file_path()
+        try:
+            # Django deletes only the temp name after the request; the data stays
+            os.link(tmp_path, dest_path)
+        except OSError:  # other filesystem, existing dest_path, no hard links
+            shutil.copyfile(tmp_path, dest_path)
+        else:
+            # Temp files are created 0600 — apply the mode a normal save would get
+            if settings.FILE_UPLOAD_PERMISSIONS is not None:
+                os.chmod(dest_path, settings.FILE_UPLOAD_PERMISSIONS)
+        return
+    upload.seek(0)
+    with open(dest_path, 'wb') as f:
+        shutil.copyfileobj(upload, f, 1 << 20)
+
+
+def _read_json(path):
+    """Parsed JSON of ``path``, re-read only when its mtime changes."""
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
+
+def _json_file_response(path):
+    """HttpResponse with the (cached) serialized JSON of ``path``."""
+    return HttpResponse(_json_bytes_cached(path, os.stat(path).st_mtime_ns),
+                        content_type='application/json')
+
+
 def _fit_to_cylinders_sequential(garment_verts, garment_faces, hull_verts,
                                    offset=0.006, stiffness=0.5, color=(0.3, 0.35, 0.5),
                                    coordinate_system='auto'):
@@ -345,17 +507,15 @@ def _generate_cylinder_hull(body_verts, gender='female'):
     - Radius = from body vertices assigned to this bone
     Returns (hull_verts, hull_faces) in Blender coords (Z-up).
     """
-    import json
     from scipy.spatial.transform import Rotation
 
     data_dir = settings.HUMANBODY_DATA_DIR
     skel_path = data_dir / 'def_skeleton.json'
     sw_path = data_dir / 'skin_weights_base.json'
 
-    with open(skel_path) as f:
-        skel_data = json.load(f)
-    with open(sw_path) as f:
-        sw_data = json.load(f)
+    # Only read here, so the cached parse is shared (re-read when a file changes)
+    skel_data = _read_json(str(skel_path))
+    sw_data = _read_json(str(sw_path))
 
     bones = skel_data['bones']
     bone_names = sw_data['bone_names']
@@ -517,17 +677,15 @@ def _generate_rig_hull(body_verts, gender='female'):
     actual body mesh vertices assigned to that bone.
     Returns (hull_verts, hull_faces) as numpy arrays in Blender coords (Z-up).
     """
-    import json
     from scipy.spatial.transform import Rotation
 
     data_dir = settings.HUMANBODY_DATA_DIR
     skel_path = data_dir / 'def_skeleton.json'
     sw_path = data_dir / 'skin_weights_base.json'
 
-    with open(skel_path) as f:
-        skel_data = json.load(f)
-    with open(sw_path) as f:
-        sw_data = json.load(f)
+    # Only read here, so the cached parse is shared (re-read when a file changes)
+    skel_data = _read_json(str(skel_path))
+    sw_data = _read_json(str(sw_path))
 
     bones = skel_data.get('bones', [])
     bone_names = sw_data.get('bone_names', [])
@@ -718,34 +876,82 @@ def _get_cc_subdivider(gender='female'):
     """
     global _cc_subdivider
     if gender not in _cc_subdivider:
-        mesh = _get_mesh_data(gender)
-        if mesh.faces is not None and mesh.faces.ndim == 2 and mesh.faces.shape[1] == 4:
-            cc = CatmullClarkSubdivider(
-                mesh.faces,
-                face_materials=mesh.face_materials,
-                uvs=mesh.uvs,
-                levels=1,
-            )
-            logger.info("CC subdivider (%s): %d base -> %d sub vertices, %d triangles",
-                        gender, mesh.faces.max() + 1, cc.sub_vertex_count,
-                        len(cc.triangles))
-
-            # Eagerly compute reference normals from basis mesh
-            basis_type = 'Male_Caucasian' if gender == 'male' else 'Female_Caucasian'
-            md = _get_morph_data()
-            cd = _get_char_defaults()
-            ref_state = CharacterState(md, cd)
-            ref_state.set_body_type(basis_type)
-            ref_verts = ref_state.compute()
-            if ref_verts is not None:
-                ref_sub = cc.subdivide(ref_verts)
-                cc.compute_quad_normals(ref_sub)
-                logger.info("CC subdivider (%s): reference normals initialised from %s",
-                            gender, basis_type)
-            _cc_subdivider[gender] = cc
+        with _cc_subdivider_lock:
+            if gender not in _cc_subdivider:
+                cc = _build_cc_subdivider(gender)
+                if cc is not None:
+                    _cc_subdivider[gender] = cc
     return _cc_subdivider.get(gender)
 
 
+def _build_cc_subdivider(gender):
+    """New CC subdivider with reference normals, or None for non-quad meshes."""
+    mesh = _get_mesh_data(gender)
+    if mesh.faces is None or mesh.faces.ndim != 2 or mesh.faces.shape[1] != 4:
+        return None
+    cc = CatmullClarkSubdivider(
+        mesh.faces,
+        face_materials=mesh.face_materials,
+        uvs=mesh.uvs,
+        levels=1,
+    )
+    logger.info("CC subdivider (%s): %d base -> %d sub vertices, %d triangles",
+                gender, mesh.faces.max() + 1, cc.sub_vertex_count,
+                len(cc.triangles))
+
+    # Eagerly compute reference normals from basis mesh
+    basis_type = 'Male_Caucasian' if gender == 'male' else 'Female_Caucasian'
+    md = _get_morph_data()
+    cd = _get_char_defaults()
+    ref_state = CharacterState(md, cd)
+    ref_state.set_body_type(basis_type)
+    ref_verts = ref_state.compute()
+    if ref_verts is not None:
+        _subdivide_with_normals(cc, ref_verts)
+        logger.info("CC subdivider (%s): reference normals initialised from %s",
+                    gender, basis_type)
+    return cc
+
+
+def _subdivide_with_normals(cc, vertices):
+    """CC-subdivide ``vertices`` and compute smooth quad normals.
+
+    Uses the subdivider's fused single-pass ``subdivide_with_normals`` when
+    the installed humanbody_core provides it, otherwise the two passes.
+    Returns (sub_verts, normals).
+    """
+    fused = getattr(cc, 'subdivide_with_normals', None)
+    if fused is not None:
+        return fused(vertices)
+    sub_verts = cc.subdivide(vertices)
+    return sub_verts, cc.compute_quad_normals(sub_verts)
+
+
+_subdivide_takes_out = {}  # {subdivider class: bool}
+
+
+def _subdivide_into(cc, vertices, out):
+    """CC-subdivide ``vertices`` into the preallocated float32 array ``out``.
+
+    Subdividers whose ``subdivide`` accepts ``out=`` write the result there
+    directly, without a float64 intermediate; otherwise the result is cast
+    into ``out``. Returns ``out``.
+    """
+    cls = type(cc)
+    takes_out = _subdivide_takes_out.get(cls)
+    if takes_out is None:
+        try:
+            takes_out = 'out' in inspect.signature(cc.subdivide).parameters
+        except (TypeError, ValueError):
+            takes_out = False
+        _subdivide_takes_out[cls] = takes_out
+    if takes_out:
+        cc.subdivide(vertices, out=out)
+    else:
+        np.copyto(out, cc.subdivide(vertices), casting='same_kind')
+    return out
+
+
 def character_viewer(request):
     """Render the Character Viewer page."""
     return render(request, 'character_viewer.html')
@@ -959,7 +1165,7 @@ def theatre_render_video(request):
     import shutil
 
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -1205,42 +1411,63 @@ def test_character_page(request):
     return render(request, 'test_character.html')
 
 
-@require_GET
-def character_mesh(request):
-    """Return base mesh data (vertices, faces, UVs) as JSON with base64 binary."""
-    body_type = request.GET.get('body_type', 'Female_Caucasian')
-    gender = _gender_from_body_type(body_type)
+def _morph_params(query):
+    """Split ``morph_<name>`` / ``meta_<name>`` query params in one pass.
 
-    md = _get_morph_data()
-    cd = _get_char_defaults()
-    mesh = _get_mesh_data(gender)
+    Returns (morphs, metas) as sorted, hashable ``(name, float)`` tuples.
+    Values that are not valid floats are skipped (as before when they were
+    applied one by one).
+    """
+    morphs, metas = [], []
+    # lists() hands out the stored value lists as-is; the last value wins,
+    # as with items()
+    for key, vals in query.lists():
+        if key[:6] == 'morph_':
+            target, name = morphs, key[6:]
+        elif key[:5] == 'meta_':
+            target, name = metas, key[5:]
+        else:
+            continue
+        if not vals:
+            continue
+        try:
+            target.append((name, float(vals[-1])))
+        except ValueError:
+            pass
+    morphs.sort()
+    metas.sort()
+    return tuple(morphs), tuple(metas)
 
-    state = CharacterState(md, cd)
-    state.set_body_type(body_type)
 
-    # Apply any morph values from query params
-    morph_prefix = 'morph_'
-    for key, val in request.GET.items():
-        if key.startswith(morph_prefix):
-            morph_name = key[len(morph_prefix):]
-            try:
-                state.set_morph(morph_name, float(val))
-            except ValueError:
-                pass
+_topology_json = {}  # {'female': bytes, 'male': bytes} — morph-independent part of the mesh response
 
-    # Apply meta values from query params (age, mass, tone, height)
-    meta_prefix = 'meta_'
-    for key, val in request.GET.items():
-        if key.startswith(meta_prefix):
-            meta_name = key[len(meta_prefix):]
-            try:
-                state.set_meta(meta_name, float(val))
-            except (ValueError, AttributeError):
-                pass
 
-    vertices = state.compute()
-    if vertices is None:
-        return JsonResponse({'error': 'Failed to compute mesh'}, status=500)
+def _get_topology_json(gender):
+    """Serialized base64 faces/UVs plus groups for the served mesh.
+
+    Returns the JSON object members without the surrounding braces (b'' if
+    the mesh has no topology), encoded once per gender so mesh responses
+    only serialize their vertices and normals.
+    """
+    if gender not in _topology_json:
+        triangles, groups, mat_names, uvs = _mesh_topology(gender)
+        topo = {}
+        if triangles is not None:
+            if groups is not None:
+                topo['groups'] = groups
+                topo['material_names'] = mat_names
+            topo['face_count'] = int(triangles.shape[0])
+        parts = {key: item for key, item in (('faces', (triangles, np.uint32)),
+                                             ('uvs', (uvs, np.float32)))
+                 if item[0] is not None}
+        topo.update(zip(parts, _b64_arrays(*parts.values())))
+        _topology_json[gender] = _dumps_json(topo)[1:-1]
+    return _topology_json[gender]
+
+
+def _resolve_mesh_request(request):
+    """Parse character_mesh query params into a hashable cache key."""
+    body_type = request.GET.get('body_type', 'Female_Caucasian')
 
     # Apply T-pose if configured in settings
     pose = request.GET.get('pose', '')
@@ -1248,106 +1475,345 @@ def character_mesh(request):
         s = AppSettings.load()
         prefs = s.ui_prefs or {}
         pose = prefs.get('default_pose', 'a_pose')
-    if pose == 't_pose':
-        tpose_path = os.path.join(str(settings.HUMANBODY_DATA_DIR), 'vertices_tpose.npy')
-        if os.path.isfile(tpose_path):
-            tpose_verts = np.load(tpose_path)
-            if tpose_verts.shape == vertices.shape:
-                vertices = tpose_verts
-                logger.info('[Mesh] Using T-pose vertices')
 
-    cc = _get_cc_subdivider(gender)
+    morphs, metas = _morph_params(request.GET)
+    return body_type, morphs, metas, pose
 
-    if cc is not None:
-        # Catmull-Clark subdivision: smooth geometry matching Blender's output
-        sub_verts = cc.subdivide(vertices)
-
-        # Compute smooth normals from quad topology (avoids triangulation artifacts)
-        normals = cc.compute_quad_normals(sub_verts)
-
-        result = {
-            'vertex_count': int(sub_verts.shape[0]),
-            'vertices': base64.b64encode(
-                sub_verts.astype(np.float32).tobytes()).decode('ascii'),
-            'normals': base64.b64encode(
-                normals.ravel().astype(np.float32).tobytes()).decode('ascii'),
-            'face_count': int(len(cc.triangles)),
-            'faces': base64.b64encode(
-                cc.triangles.ravel().astype(np.uint32).tobytes()).decode('ascii'),
-            'groups': cc.groups,
-            'material_names': mesh.material_names or [],
-        }
 
-        if cc.uvs is not None:
-            result['uvs'] = base64.b64encode(
-                cc.uvs.ravel().astype(np.float32).tobytes()).decode('ascii')
+@require_GET
+def character_mesh(request):
+    """Return base mesh data (vertices, faces, UVs) as JSON with base64 binary.
+
+    ``binary=1`` returns the character_mesh_bin blob instead.
+    With ``quantize=1`` vertices are int16 (``vertex_format: 'int16'``;
+    position = value * ``vertex_scale`` + ``vertex_center``) and normals are
+    octahedral-encoded snorm16 pairs (``normal_format: 'oct16'``).
+    With ``precision=fp16`` vertices and normals are IEEE half floats
+    (``vertex_format``/``normal_format: 'float16'``, e.g. for
+    THREE.HalfFloatType attributes). Faces always stay uint32.
+    """
+    if request.GET.get('binary') in ('1', 'true'):
+        return character_mesh_bin(request)
+    if request.GET.get('quantize') in ('1', 'true'):
+        vertex_format = 'int16'
+    elif request.GET.get('precision') == 'fp16':
+        vertex_format = 'float16'
+    else:
+        vertex_format = 'float32'
+    body = _build_mesh_response(*_resolve_mesh_request(request),
+                                vertex_format=vertex_format)
+    if body is None:
+        return JsonResponse({'error': 'Failed to compute mesh'}, status=500)
+    return HttpResponse(body, content_type='application/json')
 
-        return JsonResponse(result)
 
-    # Fallback: no CC subdivider (non-quad mesh)
-    result = {
-        'vertex_count': int(vertices.shape[0]),
-        'vertices': base64.b64encode(
-            vertices.astype(np.float32).tobytes()).decode('ascii'),
-    }
+_ARRAYS_BIN_MAGIC = b'HBA1'
+
+
+def _pack_arrays(arrays, meta=None):
+    """Pack named arrays into one self-describing little-endian blob.
+
+    Layout: ``'HBA1'``, uint32 JSON length, UTF-8 JSON (``meta`` plus
+    ``sections: [{name, dtype, shape, offset}]``), zero padding to a multiple
+    of 8, then the array data. Section offsets are relative to the start of
+    the data and 8-byte aligned. None entries are skipped.
+    """
+    sections, table, size = [], [], 0
+    for name, arr in arrays:
+        if arr is None:
+            continue
+        arr = np.ascontiguousarray(arr, dtype=np.asarray(arr).dtype.newbyteorder('<'))
+        sections.append((arr, size))
+        table.append({'name': name, 'dtype': arr.dtype.name,
+                      'shape': list(arr.shape), 'offset': size})
+        size += (arr.nbytes + 7) & ~7
+
+    head = json.dumps(dict(meta or {}, sections=table)).encode('utf-8')
+    start = (8 + len(head) + 7) & ~7
+    buf = bytearray(start + size)
+    struct.pack_into('<4sI', buf, 0, _ARRAYS_BIN_MAGIC, len(head))
+    buf[8:8 + len(head)] = head
+    for arr, off in sections:
+        np.frombuffer(buf, dtype=arr.dtype, count=arr.size, offset=start + off)[:] = arr.ravel()
+    return bytes(buf)
+
+
+def _pack_mesh_arrays(vertices, normals, triangles, uvs, meta=None):
+    """_pack_arrays blob of a mesh: float32 vertices/normals/uvs, uint32 faces."""
+    def cast(arr, dtype):
+        return None if arr is None else np.asarray(arr).astype(dtype, copy=False)
+
+    return _pack_arrays([
+        ('vertices', cast(vertices, np.float32)),
+        ('normals', cast(normals, np.float32)),
+        ('faces', cast(triangles, np.uint32)),
+        ('uvs', cast(uvs, np.float32)),
+    ], meta)
+
+
+@require_GET
+def character_mesh_bin(request):
+    """Return the character mesh as one little-endian binary blob.
+
+    Same query params as character_mesh. The blob is a _pack_arrays
+    container (``'HBA1'``, as for cloth and SMPL-X ``binary=1``) with
+    float32 ``vertices``/``normals``/``uvs`` and uint32 ``faces`` sections;
+    the JSON header carries ``groups`` and ``material_names``. Sections the
+    mesh lacks (normals without a CC subdivider, UVs) are omitted.
+    """
+    data = _build_mesh_bin(*_resolve_mesh_request(request))
+    if data is None:
+        return JsonResponse({'error': 'Failed to compute mesh'}, status=500)
+    return HttpResponse(data, content_type='application/octet-stream')
+
 
+def _build_mesh_response(body_type, morphs, metas, pose, vertex_format='float32'):
+    """Compute the serialized character_mesh payload.
+
+    ``morphs``/``metas`` are sorted ``(name, value)`` tuples from _morph_params.
+    Returns the JSON body as bytes, or None if the mesh cannot be computed.
+    """
+    geom = _mesh_geometry(body_type, morphs, metas, pose)
+    if geom is None:
+        return None
+    vertices, normals, gender = geom
+    body = _dumps_json(_mesh_payload(vertices, normals, vertex_format))
+    # Splice in the pre-encoded topology instead of re-serializing it
+    topo = _get_topology_json(gender)
+    if not topo:
+        return body
+    return b'{' + topo + b',' + body[1:]
+
+
+def _mesh_payload(vertices, normals, vertex_format='float32'):
+    """Morph-dependent members of the character_mesh JSON (no topology).
+
+    ``vertex_format`` is 'float32', 'float16' or 'int16' (see character_mesh).
+    """
+    result = {'vertex_count': int(vertices.shape[0])}
+    if vertex_format == 'int16':
+        verts16, center, scale = _quantize_positions(vertices)
+        result['vertex_format'] = 'int16'
+        result['vertex_center'] = [float(c) for c in center]
+        result['vertex_scale'] = float(scale)
+        if normals is None:
+            result['vertices'] = _b64_array(verts16)
+            return result
+        result['normal_format'] = 'oct16'
+        result['vertices'], result['normals'] = _b64_arrays(
+            (verts16, None), (_oct_encode_normals(normals), None))
+        return result
+    dtype = np.float32
+    if vertex_format == 'float16':
+        dtype = np.float16
+        result['vertex_format'] = 'float16'
+        if normals is not None:
+            result['normal_format'] = 'float16'
+    if normals is None:
+        result['vertices'] = _b64_array(vertices, dtype)
+        return result
+    result['vertices'], result['normals'] = _b64_arrays(
+        (vertices, dtype), (normals, dtype))
+    return result
+
+
+def _quantize_positions(vertices):
+    """Quantize (N,3) positions to int16 around the bbox center.
+
+    Returns (int16 array, center float32[3], scale); decode as
+    ``q * scale + center``.
+    """
+    v = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+    center = (v.min(axis=0) + v.max(axis=0)) * 0.5
+    extent = float(np.abs(v - center).max()) if len(v) else 0.0
+    scale = extent / 32767.0 if extent > 0 else 1.0
+    q = np.rint((v - center) / scale).astype(np.int16)
+    return q, center, scale
+
+
+def _oct_encode_normals(normals):
+    """Octahedral-encode (N,3) unit normals as (N,2) snorm16."""
+    n = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+    l1 = np.abs(n).sum(axis=1, keepdims=True)
+    l1[l1 == 0] = 1.0
+    p = n[:, :2] / l1
+    # Lower hemisphere folds over the diagonals
+    neg = n[:, 2] < 0
+    sign = np.where(p[neg] >= 0, 1.0, -1.0)
+    p[neg] = (1.0 - np.abs(p[neg][:, ::-1])) * sign
+    return np.rint(np.clip(p, -1.0, 1.0) * 32767.0).astype(np.int16)
+
+
+def _build_mesh_bin(body_type, morphs, metas, pose):
+    """Binary counterpart of _build_mesh_response (see character_mesh_bin)."""
+    geom = _mesh_geometry(body_type, morphs, metas, pose)
+    if geom is None:
+        return None
+    vertices, normals, gender = geom
+    triangles, groups, mat_names, uvs = _mesh_topology(gender)
+    return _pack_mesh_arrays(vertices, normals, triangles, uvs,
+                             {'groups': groups or [], 'material_names': mat_names or []})
+
+
+_mesh_topology_cache = {}  # {'female': tuple, 'male': tuple}
+
+
+def _mesh_topology(gender):
+    """Return (triangles, groups, material_names, uvs) for the served mesh.
+
+    Uses the CC subdivider's topology when available, otherwise the
+    triangulated base mesh. Entries are None when the mesh lacks them.
+    Computed once per gender — faces and materials never change after load.
+    """
+    if gender not in _mesh_topology_cache:
+        _mesh_topology_cache[gender] = _build_mesh_topology(gender)
+    return _mesh_topology_cache[gender]
+
+
+def _build_mesh_topology(gender):
+    mesh = _get_mesh_data(gender)
+    cc = _get_cc_subdivider(gender)
+    if cc is not None:
+        triangles = np.ascontiguousarray(cc.triangles, dtype=np.uint32)
+        return triangles, cc.groups, mesh.material_names or [], cc.uvs
+
+    triangles = groups = mat_names = None
     if mesh.faces is not None:
         faces = mesh.faces
         face_mats = mesh.face_materials
 
         if faces.ndim == 2 and faces.shape[1] == 4:
-            tri1 = faces[:, [0, 2, 1]]
-            tri2 = faces[:, [0, 3, 2]]
-            triangles = np.concatenate([tri1, tri2], axis=0)
+            # Both triangles of a quad go into one preallocated buffer
+            # (interleaved), so no temporaries for concatenate are needed.
+            n_quads = len(faces)
+            triangles = np.empty((2 * n_quads, 3), dtype=np.uint32)
+            triangles[0::2] = faces[:, [0, 2, 1]]
+            triangles[1::2] = faces[:, [0, 3, 2]]
             if face_mats is not None:
-                tri_mats = np.concatenate([face_mats, face_mats], axis=0)
+                tri_mats = np.empty(2 * n_quads, dtype=face_mats.dtype)
+                tri_mats[0::2] = face_mats
+                tri_mats[1::2] = face_mats
             else:
                 tri_mats = None
         else:
             triangles = faces[:, [0, 2, 1]] if faces.shape[1] == 3 else faces
             tri_mats = face_mats
+        triangles = triangles.astype(np.uint32, copy=False)
 
         if tri_mats is not None:
             sort_idx = np.argsort(tri_mats, kind='stable')
             triangles = triangles[sort_idx]
             tri_mats_sorted = tri_mats[sort_idx]
 
-            groups = []
+            # Runs of equal material → one group each (start/count in indices)
             mat_names = mesh.material_names or []
-            current_mat = tri_mats_sorted[0]
-            start = 0
-            for i in range(1, len(tri_mats_sorted)):
-                if tri_mats_sorted[i] != current_mat:
-                    groups.append({
-                        'materialIndex': int(current_mat),
-                        'start': int(start * 3),
-                        'count': int((i - start) * 3),
-                    })
-                    current_mat = tri_mats_sorted[i]
-                    start = i
-            groups.append({
-                'materialIndex': int(current_mat),
-                'start': int(start * 3),
-                'count': int((len(tri_mats_sorted) - start) * 3),
-            })
-            result['groups'] = groups
-            result['material_names'] = mat_names
+            bounds = np.concatenate((
+                [0], np.flatnonzero(np.diff(tri_mats_sorted)) + 1, [len(tri_mats_sorted)]))
+            starts = bounds[:-1]
+            # Pre-sliced Python lists: no NumPy scalar boxing inside the comprehension
+            groups = [{
+                'materialIndex': int(mat),
+                'start': start,
+                'count': count,
+            } for start, count, mat in zip((starts * 3).tolist(),
+                                           (np.diff(bounds) * 3).tolist(),
+                                           tri_mats_sorted[starts].tolist())
+            ] if len(tri_mats_sorted) else []
 
-        result['face_count'] = int(triangles.shape[0])
-        result['faces'] = base64.b64encode(
-            triangles.ravel().astype(np.uint32).tobytes()).decode('ascii')
+    return triangles, groups, mat_names, mesh.uvs
 
-    if mesh.uvs is not None:
-        result['uvs'] = base64.b64encode(
-            mesh.uvs.ravel().astype(np.float32).tobytes()).decode('ascii')
 
-    return JsonResponse(result)
+# Batch morph setter of newer humanbody_core versions (checked once)
+_HAS_SET_MORPHS = hasattr(CharacterState, 'set_morphs')
+
+
+def _character_state(body_type, morphs=(), metas=()):
+    """CharacterState for ``body_type`` with morph and meta values applied.
+
+    ``morphs``/``metas`` are ``(name, float)`` pairs (see _morph_params).
+    Morphs go in as one batch via ``set_morphs`` when the installed
+    humanbody_core has it; otherwise one by one, skipping unknown names.
+    Unknown meta names are skipped.
+    """
+    state = CharacterState(_get_morph_data(), _get_char_defaults())
+    state.set_body_type(body_type)
+
+    # Apply morph values (one batch if possible, else one by one)
+    if _HAS_SET_MORPHS:
+        state.set_morphs(dict(morphs))
+    else:
+        for morph_name, val in morphs:
+            try:
+                state.set_morph(morph_name, val)
+            except (ValueError, AttributeError):
+                pass
+
+    # Apply meta values (age, mass, tone, height)
+    for meta_name, val in metas:
+        try:
+            state.set_meta(meta_name, val)
+        except (ValueError, AttributeError):
+            pass
+    return state
+
+
+# Only the morph-dependent float32 arrays are kept (~2 MB per entry); the
+# serialized responses are rebuilt around the shared topology per request
+@functools.lru_cache(maxsize=8)
+def _mesh_geometry(body_type, morphs, metas, pose):
+    """Memoized _compute_mesh_geometry with read-only float32 arrays."""
+    geom = _compute_mesh_geometry(body_type, morphs, metas, pose)
+    if geom is None:
+        return None
+    vertices, normals, gender = geom
+    vertices = np.array(vertices, dtype=np.float32)
+    vertices.flags.writeable = False
+    if normals is not None:
+        normals = np.array(normals, dtype=np.float32)
+        normals.flags.writeable = False
+    return vertices, normals, gender
+
+
+def _compute_mesh_geometry(body_type, morphs, metas, pose):
+    """Morph, pose and subdivide the body mesh.
+
+    Returns (vertices, normals, gender) — normals is None without a CC
+    subdivider — or None if the mesh cannot be computed.
+    """
+    gender = _gender_from_body_type(body_type)
+
+    vertices = _character_state(body_type, morphs, metas).compute()
+    if vertices is None:
+        return None
+
+    if pose == 't_pose':
+        tpose_path = os.path.join(str(settings.HUMANBODY_DATA_DIR), 'vertices_tpose.npy')
+        if os.path.isfile(tpose_path):
+            tpose_verts = np.load(tpose_path)
+            if tpose_verts.shape == vertices.shape:
+                vertices = tpose_verts
+                logger.info('[Mesh] Using T-pose vertices')
+
+    cc = _get_cc_subdivider(gender)
+    if cc is None:
+        return vertices, None, gender
+
+    # Catmull-Clark subdivision: smooth geometry matching Blender's output,
+    # smooth normals from quad topology (avoids triangulation artifacts)
+    sub_verts, normals = _subdivide_with_normals(cc, vertices)
+    return sub_verts, normals, gender
 
 
 @require_GET
 def character_morphs(request):
     """Return list of available morphs and body types."""
     body_type = request.GET.get('body_type', 'Female_Caucasian')
+    return HttpResponse(_morphs_json(body_type), content_type='application/json')
+
+
+@functools.lru_cache(maxsize=16)
+def _morphs_json(body_type):
+    """Serialized character_morphs payload — fixed per deployment and body type."""
     md = _get_morph_data()
     cd = _get_char_defaults()
 
@@ -1356,14 +1822,6 @@ def character_morphs(request):
 
     morphs = state.get_morph_list()
 
-    # Group by category
-    categories = {}
-    for m in morphs:
-        cat = m['category']
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(m)
-
     # Build meta slider definitions from CharacterDefaults
     meta_sliders = {}
     meta_labels = {'age': 'Age', 'mass': 'Mass (kg)', 'tone': 'Tone', 'height': 'Height (cm)'}
@@ -1375,10 +1833,10 @@ def character_morphs(request):
                 'default': sdef.default, 'label': meta_labels[name],
             }
 
-    return JsonResponse({
+    return _dumps_json({
         'body_types': MorphData.BODY_TYPES,
         'morphs': morphs,
-        'categories': sorted(categories.keys()),
+        'categories': sorted({m['category'] for m in morphs}),
         'skin_colors': MorphData.SKIN_COLORS,
         'meta_sliders': meta_sliders,
     })
@@ -1390,7 +1848,7 @@ def character_rig(request):
     mesh = _get_mesh_data()
 
     if mesh.rig_bones:
-        return JsonResponse(mesh.rig_bones)
+        return _fast_json_response(mesh.rig_bones)
 
     # Fallback: no rig data exported yet
     return JsonResponse({
@@ -1412,12 +1870,10 @@ def character_rigify_skeleton(request):
     skel_path = os.path.join(data_dir, 'def_skeleton.json')
     if not os.path.isfile(skel_path):
         return JsonResponse({'error': 'DEF skeleton not exported yet'}, status=404)
-    with open(skel_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return JsonResponse(data)
+    return _json_file_response(skel_path)
 
 
-_propagated_skin_weights = {}  # {'female': data, 'male': data}
+_propagated_skin_weights = {}  # {'female': JSON bytes, 'male': JSON bytes}
 _base_skin_weights = {}        # {'female': data, 'male': data}
 _base_skin_arrays = {}         # {'female': (indices, weights), 'male': ...}
 
@@ -1437,14 +1893,12 @@ def _get_base_skin_weights(gender='female'):
         data_dir = str(settings.HUMANBODY_DATA_DIR)
     base_path = os.path.join(data_dir, 'skin_weights_base.json')
     if os.path.isfile(base_path):
-        with open(base_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json_file(base_path)
 
         # Filter non-DEF bones (same logic as character_skin_weights)
         skel_path = os.path.join(data_dir, 'def_skeleton.json')
         if os.path.isfile(skel_path):
-            with open(skel_path, 'r', encoding='utf-8') as sf:
-                skel_data = json.load(sf)
+            skel_data = _read_json(skel_path)
             skel_names = {b['name'] for b in skel_data['bones']}
             old_names = data['bone_names']
             remove_indices = {i for i, n in enumerate(old_names) if n not in skel_names}
@@ -1473,32 +1927,245 @@ def _get_base_skin_weights(gender='female'):
     return _base_skin_weights.get(gender)
 
 
+_body_trees = collections.OrderedDict()   # vertex digest → cKDTree, LRU
+_body_trees_lock = threading.Lock()
+_BODY_TREES_MAX = 8
+
+
+def _body_tree(vertices):
+    """cKDTree over body vertices, reused while the same body is requested.
+
+    Keyed by a digest of the vertex data, so every caller (cloth, hair,
+    garments) shares trees without threading morph parameters through.
+    """
+    from scipy.spatial import cKDTree
+    vertices = np.ascontiguousarray(vertices)
+    key = (vertices.shape, vertices.dtype.str,
+           hashlib.blake2b(vertices.data, digest_size=16).digest())
+    with _body_trees_lock:
+        tree = _body_trees.get(key)
+        if tree is not None:
+            _body_trees.move_to_end(key)
+            return tree
+    tree = cKDTree(vertices)
+    with _body_trees_lock:
+        _body_trees[key] = tree
+        while len(_body_trees) > _BODY_TREES_MAX:
+            _body_trees.popitem(last=False)
+    return tree
+
+
+def _top4_skin_arrays(vertex_weights, n):
+    """Top-4 influences per vertex as (N,4) float32 index/weight arrays.
+
+    ``vertex_weights`` is a list of ``[(bone_index, weight), ...]`` per vertex.
+    Influences are ordered by weight (ties keep their input order), weights
+    renormalized to sum 1; vertices without influences stay zero.
+    """
+    counts = np.fromiter(map(len, vertex_weights), dtype=np.intp, count=n)
+    indices = np.zeros((n, 4), dtype=np.float32)
+    weights = np.zeros((n, 4), dtype=np.float32)
+    total_infs = int(counts.sum())
+    if total_infs == 0:
+        return indices, weights
+    # Stream the (bone, weight) pairs straight into one buffer — no
+    # intermediate Python list of all influences
+    chain = itertools.chain.from_iterable
+    flat = np.fromiter(chain(chain(vertex_weights)), dtype=np.float64,
+                       count=2 * total_infs).reshape(total_infs, 2)
+
+    # Scatter the ragged lists into a padded (N, K) grid; padding sorts last
+    k = int(counts.max())
+    rows = np.repeat(np.arange(n), counts)
+    cols = np.arange(total_infs) - np.repeat(np.cumsum(counts) - counts, counts)
+    pad_w = np.full((n, k), -np.inf)
+    pad_i = np.zeros((n, k))
+    pad_w[rows, cols] = flat[:, 1]
+    pad_i[rows, cols] = flat[:, 0]
+
+    order = np.argsort(-pad_w, axis=1, kind='stable')[:, :4]
+    top_w = np.take_along_axis(pad_w, order, axis=1)
+    top_i = np.take_along_axis(pad_i, order, axis=1)
+    valid = np.isfinite(top_w)
+    top_w = np.where(valid, top_w, 0.0)
+    top_i = np.where(valid, top_i, 0.0)
+    total = top_w.sum(axis=1, keepdims=True)
+    total[total == 0] = 1.0
+
+    m = top_w.shape[1]
+    indices[:, :m] = top_i
+    weights[:, :m] = top_w / total
+    return indices, weights
+
+
 def _get_base_skin_arrays(gender='female'):
+    """Compact (N,4) skin index/weight arrays, see _load_base_skin_arrays."""
+    if gender in _base_skin_arrays:
+        return _base_skin_arrays[gender]
+    with _skin_arrays_lock:
+        return _load_base_skin_arrays(gender)
+
+
+def _load_base_skin_arrays(gender):
     """Precompute compact (N,4) index/weight arrays for fast nearest-vertex
-    skin weight lookup.  Cached after first call."""
+    skin weight lookup (call under the lock).  Cached after first call and in
+    skin_weights_base.cache.npy.
+
+    The cache file holds both arrays stacked as (2, N, 4) float32 and is
+    memory-mapped read-only, so all worker processes share one copy through
+    the OS page cache. Callers only index into the arrays (fancy indexing
+    copies), never write to them.
+    """
     global _base_skin_arrays
-    if gender in _base_skin_arrays:
+    if gender in _base_skin_arrays:  # built while we waited for the lock
         return _base_skin_arrays[gender]
+
+    # On-disk cache next to the JSON, valid while newer than both inputs
+    if gender == 'male':
+        data_dir = str(settings.HUMANBODY_DATA_DIR) + '_male'
+    else:
+        data_dir = str(settings.HUMANBODY_DATA_DIR)
+    cache_path = os.path.join(data_dir, 'skin_weights_base.cache.npy')
+    skel_path = os.path.join(data_dir, 'def_skeleton.json')
+    sources = [os.path.join(data_dir, 'skin_weights_base.json')]
+    if os.path.isfile(skel_path):
+        sources.append(skel_path)
+    try:
+        cache_mtime = os.stat(cache_path).st_mtime_ns
+        if all(os.stat(p).st_mtime_ns <= cache_mtime for p in sources):
+            _base_skin_arrays[gender] = _map_skin_cache(cache_path)
+            return _base_skin_arrays[gender]
+    except (OSError, ValueError):
+        pass
+
     sw = _get_base_skin_weights(gender)
     if sw is None:
         return None
     n = sw['vertex_count']
-    indices = np.zeros((n, 4), dtype=np.float32)
-    weights = np.zeros((n, 4), dtype=np.float32)
-    for v in range(n):
-        infs = sw['weights'][v]
-        if not infs:
-            continue
-        infs_sorted = sorted(infs, key=lambda x: x[1], reverse=True)[:4]
-        total = sum(w for _, w in infs_sorted) or 1.0
-        for j, (bi, bw) in enumerate(infs_sorted):
-            indices[v, j] = bi
-            weights[v, j] = bw / total
+    indices, weights = _top4_skin_arrays(sw['weights'][:n], n)
     _base_skin_arrays[gender] = (indices, weights)
     logger.info("Base skin arrays (%s) precomputed: %d vertices, 4 influences", gender, n)
+
+    tmp_path = cache_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.stack((indices, weights)))
+        os.replace(tmp_path, cache_path)
+        # Switch to the shared mapping right away (frees the private copy)
+        _base_skin_arrays[gender] = _map_skin_cache(cache_path)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not write %s: %s", cache_path, e)
     return _base_skin_arrays[gender]
 
 
+def _map_skin_cache(cache_path):
+    """Memory-map a skin_weights_base.cache.npy → (indices, weights) views."""
+    stacked = np.load(cache_path, mmap_mode='r')
+    if stacked.ndim != 3 or stacked.shape[0] != 2 or stacked.shape[2] != 4:
+        raise ValueError(f'unexpected skin cache shape {stacked.shape}')
+    return stacked[0], stacked[1]
+
+
+def _get_propagated_skin_weights(gender='female'):
+    """Serialized CC-propagated skin weights (JSON bytes), or None.
+
+    See _load_propagated_skin_weights; built at most once at a time.
+    """
+    if gender in _propagated_skin_weights:
+        return _propagated_skin_weights[gender]
+    with _propagated_skin_lock:
+        return _load_propagated_skin_weights(gender)
+
+
+def _load_propagated_skin_weights(gender):
+    """Load or build the CC-propagated skin weights (call under the lock).
+
+    Propagation through the subdivision is slow, so the result is also
+    persisted as skin_weights_propagated.json next to the base weights and
+    rebuilt only when that file is older than its inputs (base weights, DEF
+    skeleton, Catmull-Clark code). Returns None if there are no base weights
+    or no CC subdivider.
+    """
+    global _propagated_skin_weights
+    if gender in _propagated_skin_weights:  # built while we waited for the lock
+        return _propagated_skin_weights[gender]
+
+    if gender == 'male':
+        data_dir = str(settings.HUMANBODY_DATA_DIR) + '_male'
+    else:
+        data_dir = str(settings.HUMANBODY_DATA_DIR)
+    base_path = os.path.join(data_dir, 'skin_weights_base.json')
+    if not os.path.isfile(base_path):
+        return None
+    skel_path = os.path.join(data_dir, 'def_skeleton.json')
+    cache_path = os.path.join(data_dir, 'skin_weights_propagated.json')
+
+    sources = [base_path, sys.modules[CatmullClarkSubdivider.__module__].__file__]
+    if os.path.isfile(skel_path):
+        sources.append(skel_path)
+    try:
+        if os.stat(cache_path).st_mtime_ns >= max(os.stat(p).st_mtime_ns for p in sources):
+            with open(cache_path, 'rb') as f:
+                _propagated_skin_weights[gender] = f.read()
+            logger.info("Propagated skin weights (%s) loaded from %s", gender, cache_path)
+            return _propagated_skin_weights[gender]
+    except OSError:
+        pass
+
+    cc = _get_cc_subdivider(gender)
+    if cc is None:
+        return None
+
+    base_data = _load_json_file(base_path)
+
+    # Filter out non-deforming bones (e.g. corrective_smooth_inv)
+    # that don't exist in the DEF skeleton and cause SkinnedMesh artifacts.
+    if os.path.isfile(skel_path):
+        skel_data = _read_json(skel_path)
+        skel_names = {b['name'] for b in skel_data['bones']}
+        old_names = base_data['bone_names']
+        remove_indices = {i for i, n in enumerate(old_names) if n not in skel_names}
+        if remove_indices:
+            logger.info("Filtering %d non-DEF bones from skin weights: %s",
+                        len(remove_indices),
+                        [old_names[i] for i in remove_indices])
+            new_names = [n for i, n in enumerate(old_names) if i not in remove_indices]
+            # Remap bone indices and renormalize weights
+            idx_map = {}
+            new_idx = 0
+            for old_idx in range(len(old_names)):
+                if old_idx not in remove_indices:
+                    idx_map[old_idx] = new_idx
+                    new_idx += 1
+            new_weights = []
+            for pairs in base_data['weights']:
+                filtered = [(idx_map[bi], w) for bi, w in pairs
+                            if bi not in remove_indices and bi in idx_map]
+                # Renormalize
+                total = sum(w for _, w in filtered)
+                if total > 0 and abs(total - 1.0) > 1e-6:
+                    filtered = [(bi, w / total) for bi, w in filtered]
+                new_weights.append(filtered)
+            base_data['bone_names'] = new_names
+            base_data['weights'] = new_weights
+
+    logger.info("Propagating skin weights (%s) through CC subdivision: %d base -> %d sub",
+                gender, base_data['vertex_count'], cc.sub_vertex_count)
+    body = _dumps_json(cc.propagate_skin_weights(
+        base_data['weights'], base_data['bone_names']))
+
+    tmp_path = cache_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not write %s: %s", cache_path, e)
+
+    _propagated_skin_weights[gender] = body
+    return body
+
+
 @require_GET
 def character_skin_weights(request):
     """Return skin weight data for GPU skinning.
@@ -1506,192 +2173,316 @@ def character_skin_weights(request):
     Loads base-mesh weights and propagates through Catmull-Clark subdivision
     to match the viewer's subdivided vertex ordering.
     """
-    global _propagated_skin_weights
     body_type = request.GET.get('body_type', 'Female_Caucasian')
     gender = _gender_from_body_type(body_type)
 
-    if gender in _propagated_skin_weights:
-        return JsonResponse(_propagated_skin_weights[gender])
+    body = _get_propagated_skin_weights(gender)
+    if body is not None:
+        return HttpResponse(body, content_type='application/json')
 
     if gender == 'male':
         data_dir = str(settings.HUMANBODY_DATA_DIR) + '_male'
     else:
         data_dir = str(settings.HUMANBODY_DATA_DIR)
-    base_path = os.path.join(data_dir, 'skin_weights_base.json')
-    if os.path.isfile(base_path):
-        cc = _get_cc_subdivider(gender)
-        if cc is not None:
-            with open(base_path, 'r', encoding='utf-8') as f:
-                base_data = json.load(f)
-
-            # Filter out non-deforming bones (e.g. corrective_smooth_inv)
-            # that don't exist in the DEF skeleton and cause SkinnedMesh artifacts.
-            skel_path = os.path.join(data_dir, 'def_skeleton.json')
-            if os.path.isfile(skel_path):
-                with open(skel_path, 'r', encoding='utf-8') as sf:
-                    skel_data = json.load(sf)
-                skel_names = {b['name'] for b in skel_data['bones']}
-                old_names = base_data['bone_names']
-                remove_indices = {i for i, n in enumerate(old_names) if n not in skel_names}
-                if remove_indices:
-                    logger.info("Filtering %d non-DEF bones from skin weights: %s",
-                                len(remove_indices),
-                                [old_names[i] for i in remove_indices])
-                    new_names = [n for i, n in enumerate(old_names) if i not in remove_indices]
-                    # Remap bone indices and renormalize weights
-                    idx_map = {}
-                    new_idx = 0
-                    for old_idx in range(len(old_names)):
-                        if old_idx not in remove_indices:
-                            idx_map[old_idx] = new_idx
-                            new_idx += 1
-                    new_weights = []
-                    for pairs in base_data['weights']:
-                        filtered = [(idx_map[bi], w) for bi, w in pairs
-                                    if bi not in remove_indices and bi in idx_map]
-                        # Renormalize
-                        total = sum(w for _, w in filtered)
-                        if total > 0 and abs(total - 1.0) > 1e-6:
-                            filtered = [(bi, w / total) for bi, w in filtered]
-                        new_weights.append(filtered)
-                    base_data['bone_names'] = new_names
-                    base_data['weights'] = new_weights
-
-            logger.info("Propagating skin weights (%s) through CC subdivision: %d base -> %d sub",
-                        gender, base_data['vertex_count'], cc.sub_vertex_count)
-            _propagated_skin_weights[gender] = cc.propagate_skin_weights(
-                base_data['weights'], base_data['bone_names'])
-            return JsonResponse(_propagated_skin_weights[gender])
 
     # Fallback: serve raw skin_weights.json (may have wrong vertex ordering!)
     sw_path = os.path.join(data_dir, 'skin_weights.json')
     if not os.path.isfile(sw_path):
         return JsonResponse({'error': 'Skin weights not found'}, status=404)
-    with open(sw_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
     logger.error("Using raw skin_weights.json — vertex ordering may not match CC subdivision!")
-    return JsonResponse(data)
+    return _json_file_response(sw_path)
+
+
+_WARDROBE_CATEGORIES = ("Tops", "Bottoms", "Skirts", "Full", "Underwear",
+                        "Shoes", "Accessories", "Other")
+_dir_listing_cache = {}  # key → (mtime signature, serialized JSON)
+
+
+def _mtime_signature(paths):
+    """mtime_ns per path (None if missing) — changes as soon as a file is
+    written or an entry is added to or removed from a directory."""
+    sig = []
+    for path in paths:
+        try:
+            sig.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+
+def _cached_dir_listing(key, paths, build):
+    """Serialized ``build()`` result, rebuilt only when the mtime of
+    ``paths`` (one path or a list of files/directories) changes — files
+    added, removed or atomically replaced."""
+    sig = _mtime_signature((paths,) if isinstance(paths, str) else paths)
+    hit = _dir_listing_cache.get(key)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    body = _dumps_json(build())
+    _dir_listing_cache[key] = (sig, body)
+    return body
 
 
 @require_GET
 def character_wardrobe(request):
-    """Return list of available wardrobe assets."""
-    glb_dir = settings.HUMANBODY_ASSETS_GLB_DIR
-    manifest_path = os.path.join(str(glb_dir), 'manifest.json')
+    """Return list of available wardrobe assets.
 
+    The serialized listing is kept in memory until the manifest or one of
+    the scanned directories changes (one stat per path instead of a scan).
+    """
+    glb_dir = str(settings.HUMANBODY_ASSETS_GLB_DIR)
+    manifest_path = os.path.join(glb_dir, 'manifest.json')
+    assets_dir = str(settings.HUMANBODY_ASSETS_DIR)
+
+    paths = ([manifest_path, glb_dir, assets_dir] +
+             [os.path.join(assets_dir, c) for c in _WARDROBE_CATEGORIES])
+    body = _cached_dir_listing(
+        'wardrobe', paths, lambda: _scan_wardrobe(glb_dir, manifest_path, assets_dir))
+    return HttpResponse(body, content_type='application/json')
+
+
+def _scan_wardrobe(glb_dir, manifest_path, assets_dir):
     if os.path.isfile(manifest_path):
         with open(manifest_path, 'r', encoding='utf-8') as f:
             manifest = json.load(f)
         # Add URLs
         for asset in manifest.get('assets', []):
             asset['glb_url'] = f"/api/character/asset/{asset['name']}/"
-        return JsonResponse(manifest)
+        return manifest
 
     # Fallback: scan assets directory for .blend files (names only)
-    assets_dir = str(settings.HUMANBODY_ASSETS_DIR)
     assets = []
     if os.path.isdir(assets_dir):
-        cat_dirs = {"Tops", "Bottoms", "Skirts", "Full", "Underwear",
-                    "Shoes", "Accessories", "Other"}
-        for entry in sorted(os.listdir(assets_dir)):
-            full = os.path.join(assets_dir, entry)
-            if os.path.isdir(full) and entry in cat_dirs:
-                for sub in sorted(os.listdir(full)):
-                    sub_full = os.path.join(full, sub)
-                    if os.path.isdir(sub_full):
-                        assets.append({
-                            'name': sub,
-                            'category': entry,
-                            'glb_url': f"/api/character/asset/{sub}/",
-                            'has_glb': os.path.isfile(
-                                os.path.join(str(glb_dir), f"{sub}.glb")),
-                        })
+        # One directory read instead of an isfile() per asset
+        try:
+            glb_names = set(os.listdir(glb_dir))
+        except OSError:
+            glb_names = set()
+        with os.scandir(assets_dir) as it:
+            cats = sorted((e for e in it if e.name in _WARDROBE_CATEGORIES and e.is_dir()),
+                          key=lambda e: e.name)
+        for cat in cats:
+            with os.scandir(cat.path) as it:
+                subs = sorted(e.name for e in it if e.is_dir())
+            for sub in subs:
+                assets.append({
+                    'name': sub,
+                    'category': cat.name,
+                    'glb_url': f"/api/character/asset/{sub}/",
+                    'has_glb': f"{sub}.glb" in glb_names,
+                })
+
+    return {'assets': assets}
 
-    return JsonResponse({'assets': assets})
+
+_BVH_FRAMES_RE = re.compile(rb'^\s*Frames:\s*(\d+)\s*$', re.MULTILINE)
+_BVH_HEAD_CHUNK = 8192
 
 
 def _read_bvh_frames_from_file(bvh_path):
-    """Liest den Frames-Zähler aus dem BVH-Header. 0 bei Fehler."""
+    """Liest den Frames-Zähler aus dem BVH-Header. 0 bei Fehler.
+
+    Liest binär in 8-KB-Blöcken bis zur Frames-Zeile — normalerweise genügt
+    der erste Block, große Hierarchien lesen weiter, die Motion-Daten nie.
+    """
     try:
-        with open(bvh_path, 'r') as f:
-            for line in f:
-                if line.strip().startswith('Frames:'):
-                    return int(line.strip().split(':')[1])
+        with open(bvh_path, 'rb') as f:
+            head = bytearray()
+            while True:
+                chunk = f.read(_BVH_HEAD_CHUNK)
+                head += chunk
+                m = _BVH_FRAMES_RE.search(head)
+                # Zahl nur übernehmen, wenn die Zeile vollständig gelesen ist
+                if m and (m.end() < len(head) or not chunk):
+                    return int(m.group(1))
+                if not chunk or b'Frame Time:' in head:
+                    return 0
     except (IOError, ValueError):
         pass
     return 0
 
 
+_anims_cache = {'key': None, 'body': None}
+# path → (mtime_ns, frames); erspart nach dem ersten Scan DB und Dateizugriffe
+_bvh_frames_cache = {}
+
+
+def _resolve_bvh_frames(misses):
+    """Frames-Zähler für Dateien ohne gültigen Speicher-Eintrag ermitteln.
+
+    ``misses`` ist eine Liste ``(anim, path, mtime_ns)``; ``anim['frames']``
+    wird gesetzt. Zuerst der DB-Cache (BVHFile, nur die fehlenden Pfade),
+    erst bei abweichender mtime wird die Datei selbst gelesen.
+    """
+    paths = [path for _, path, _ in misses]
+    cache = {}
+    # Chunks — SQLite hat ein Parameter-Limit für IN (...)
+    for i in range(0, len(paths), 500):
+        for rec in BVHFile.objects.filter(path__in=paths[i:i + 500]).only(
+                'path', 'frame_count', 'mtime_ns'):
+            cache[rec.path] = rec
+    to_create, to_update = [], []
+
+    for anim, bvh_path, mtime in misses:
+        rec = cache.get(bvh_path)
+        if rec is not None and rec.mtime_ns == mtime:
+            frames = rec.frame_count
+        else:
+            frames = _read_bvh_frames_from_file(bvh_path)
+            if rec is not None:
+                rec.mtime_ns = mtime
+                rec.frame_count = frames
+                to_update.append(rec)
+            else:
+                to_create.append(BVHFile(
+                    name=anim['name'], path=bvh_path, source='library',
+                    frame_count=frames, mtime_ns=mtime,
+                ))
+        anim['frames'] = frames
+        _bvh_frames_cache[bvh_path] = (mtime, frames)
+
+    # Bulk-Persistenz — batch_size begrenzt SQL-Statement-Länge (SQLite hat Parameter-Limit)
+    if to_create:
+        BVHFile.objects.bulk_create(to_create, ignore_conflicts=True, batch_size=500)
+    if to_update:
+        BVHFile.objects.bulk_update(to_update, fields=['frame_count', 'mtime_ns'], batch_size=500)
+
+
+def _bvh_dirs_signature(bvh_root):
+    """mtime_ns von bvh_root und allen Kategorie-Ordnern (None wenn nicht vorhanden).
+
+    Hinzufügen/Entfernen/Umbenennen einer BVH ändert die mtime ihres Ordners.
+    """
+    try:
+        sig = [('', os.stat(bvh_root).st_mtime_ns)]
+        with os.scandir(bvh_root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        sig.append((entry.name, entry.stat().st_mtime_ns))
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    return tuple(sorted(sig))
+
+
 @require_GET
 def character_animations(request):
     """Liste aller BVH-Animationen, gruppiert nach Kategorie.
 
-    Performance: Frames-Zähler werden in der DB (BVHFile-Model) gecacht. Bei jedem
-    Aufruf werden nur neue/geänderte Dateien (mtime != Cache) tatsächlich eingelesen.
+    Performance: Frames-Zähler werden pro Datei (Pfad, mtime) im Speicher und in
+    der DB (BVHFile-Model) gecacht. Die DB wird nur für Dateien ohne gültigen
+    Speicher-Eintrag befragt, eingelesen werden nur neue/geänderte Dateien.
     Das Initial-Scan kostet ~10s (7000 Dateien); danach instant bis Dateien geändert
-    werden.
+    werden. Solange sich die mtimes der Kategorie-Ordner nicht ändern, wird die
+    serialisierte Antwort direkt aus dem Speicher geliefert.
     """
     bvh_root = os.path.dirname(str(settings.HUMANBODY_BVH_DIR))
-    categories = {}
 
-    # DB-Cache bulk laden: path → BVHFile
-    cache = {rec.path: rec for rec in BVHFile.objects.only('path', 'frame_count', 'mtime_ns').iterator()}
-    to_create, to_update = [], []
+    # Verzeichnisse unverändert → fertig serialisierte Antwort aus dem Speicher
+    sig = _bvh_dirs_signature(bvh_root)
+    if sig is not None and sig == _anims_cache['key']:
+        return HttpResponse(_anims_cache['body'], content_type='application/json')
+
+    categories = {}
+    misses = []  # (anim-dict, path, mtime) — weder im Speicher noch frisch geprüft
 
     if os.path.isdir(bvh_root):
-        for cat_name in sorted(os.listdir(bvh_root)):
-            cat_path = os.path.join(bvh_root, cat_name)
+        with os.scandir(bvh_root) as it:
+            cat_entries = sorted(it, key=lambda e: e.name)
+        for cat_entry in cat_entries:
+            cat_name = cat_entry.name
+            cat_path = cat_entry.path
             try:
-                if not os.path.isdir(cat_path):
+                if not cat_entry.is_dir():
                     continue
             except OSError:
                 continue  # skip broken entries like 'nul' on Windows
 
             anims = []
             try:
-                entries = sorted(os.listdir(cat_path))
+                with os.scandir(cat_path) as it:
+                    entries = sorted((e for e in it if e.name.lower().endswith('.bvh')),
+                                     key=lambda e: e.name)
             except OSError:
                 continue
-            for fname in entries:
-                if not fname.lower().endswith('.bvh'):
-                    continue
-                bvh_path = os.path.join(cat_path, fname)
+            for entry in entries:
+                fname = entry.name
+                bvh_path = entry.path
                 name = fname[:-4]
                 try:
-                    st = os.stat(bvh_path)
+                    st = entry.stat()
                 except OSError:
                     continue
-                mtime = st.st_mtime_ns
-                rec = cache.get(bvh_path)
-                if rec is not None and rec.mtime_ns == mtime:
-                    frames = rec.frame_count
-                else:
-                    frames = _read_bvh_frames_from_file(bvh_path)
-                    if rec is not None:
-                        rec.mtime_ns = mtime
-                        rec.frame_count = frames
-                        to_update.append(rec)
-                    else:
-                        to_create.append(BVHFile(
-                            name=name, path=bvh_path, source='library',
-                            frame_count=frames, mtime_ns=mtime,
-                        ))
-                anims.append({
+                anim = {
                     'name': name,
                     'category': cat_name,
                     'url': f"/api/character/bvh/{cat_name}/{name}/",
-                    'frames': frames,
-                })
+                    'frames': 0,
+                }
+                hit = _bvh_frames_cache.get(bvh_path)
+                if hit is not None and hit[0] == st.st_mtime_ns:
+                    anim['frames'] = hit[1]
+                else:
+                    misses.append((anim, bvh_path, st.st_mtime_ns))
+                anims.append(anim)
             if anims:
                 categories[cat_name] = anims
 
-    # Bulk-Persistenz — batch_size begrenzt SQL-Statement-Länge (SQLite hat Parameter-Limit)
-    if to_create:
-        BVHFile.objects.bulk_create(to_create, ignore_conflicts=True, batch_size=500)
-    if to_update:
-        BVHFile.objects.bulk_update(to_update, fields=['frame_count', 'mtime_ns'], batch_size=500)
+    if misses:
+        _resolve_bvh_frames(misses)
+
+    body = _dumps_json({'categories': categories})
+    _anims_cache['body'] = body
+    _anims_cache['key'] = sig
+    return HttpResponse(body, content_type='application/json')
+
+
+def _send_file(request, path, content_type, filename):
+    """Serve a file, letting the front-end web server send it when configured.
 
-    return JsonResponse({'categories': categories})
+    Responses carry ``ETag``/``Last-Modified`` (from mtime and size) and
+    ``Cache-Control: no-cache``: browsers revalidate and get an empty 304
+    while the file is unchanged, and still see edits immediately.
+
+    If ``path`` lies under a directory in settings.SENDFILE_ACCEL_ROOTS
+    (``{directory: internal_url_prefix}``), respond with an empty body and
+    ``X-Accel-Redirect`` so nginx streams the file itself. Otherwise use
+    FileResponse, which goes through ``wsgi.file_wrapper`` (sendfile) when
+    the server provides it; under ASGI it is streamed in 1 MiB blocks
+    instead of Django's default 4 KiB.
+    """
+    from django.utils.cache import get_conditional_response
+    from django.utils.http import http_date
+
+    st = os.stat(path)
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    last_modified = int(st.st_mtime)
+    not_modified = get_conditional_response(
+        request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    response = None
+    for root, prefix in getattr(settings, 'SENDFILE_ACCEL_ROOTS', {}).items():
+        try:
+            rel = os.path.relpath(path, str(root))
+        except ValueError:
+            continue  # different drive (Windows)
+        if not rel.startswith('..') and not os.path.isabs(rel):
+            from urllib.parse import quote
+            response = HttpResponse(content_type=content_type)
+            response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(rel.replace(os.sep, '/'))
+            response['Content-Disposition'] = f'inline; filename="{filename}"'
+            break
+    if response is None:
+        response = FileResponse(open(path, 'rb'), content_type=content_type, filename=filename)
+        response.block_size = 1 << 20
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'no-cache'
+    return response
 
 
 def character_asset_glb(request, name):
@@ -1699,11 +2490,7 @@ def character_asset_glb(request, name):
     glb_path = os.path.join(str(settings.HUMANBODY_ASSETS_GLB_DIR), f"{name}.glb")
     if not os.path.isfile(glb_path):
         return HttpResponseNotFound(f'GLB not found: {name}')
-    return FileResponse(
-        open(glb_path, 'rb'),
-        content_type='model/gltf-binary',
-        filename=f'{name}.glb',
-    )
+    return _send_file(request, glb_path, 'model/gltf-binary', f'{name}.glb')
 
 
 def character_bvh_file(request, name):
@@ -1711,11 +2498,7 @@ def character_bvh_file(request, name):
     bvh_path = os.path.join(str(settings.HUMANBODY_BVH_DIR), f"{name}.bvh")
     if not os.path.isfile(bvh_path):
         return HttpResponseNotFound(f'BVH not found: {name}')
-    return FileResponse(
-        open(bvh_path, 'rb'),
-        content_type='text/plain',
-        filename=f'{name}.bvh',
-    )
+    return _send_file(request, bvh_path, 'text/plain', f'{name}.bvh')
 
 
 # =========================================================================
@@ -1791,9 +2574,7 @@ def scene_detail(request, name):
         return JsonResponse({'error': 'Invalid path'}, status=400)
     if not os.path.isfile(fpath):
         return HttpResponseNotFound(f'Scene not found: {name}')
-    with open(fpath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return JsonResponse(data)
+    return _json_file_response(fpath)
 
 
 @csrf_exempt
@@ -1801,7 +2582,7 @@ def scene_detail(request, name):
 def scene_save(request):
     """Save a scene JSON file."""
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -1810,7 +2591,7 @@ def scene_save(request):
     if not name or not data:
         return JsonResponse({'error': 'name and data required'}, status=400)
 
-    safe_name = re.sub(r'[^\w\s\-]', '', name).strip()
+    safe_name = _safe_name(name)
     if not safe_name:
         return JsonResponse({'error': 'Invalid name'}, status=400)
 
@@ -1830,24 +2611,24 @@ def scene_save(request):
 
 @require_GET
 def character_models(request):
-    """Return list of available model presets."""
+    """Return list of available model presets.
+
+    The list only depends on the file names, so it is rebuilt only when the
+    models directory's mtime changes.
+    """
     models_dir = str(settings.HUMANBODY_MODELS_DIR)
-    presets = []
-    if os.path.isdir(models_dir):
-        for fname in sorted(os.listdir(models_dir)):
-            if fname.endswith('.json') and not fname.endswith('.scene.json'):
-                name = fname[:-5]
-                fpath = os.path.join(models_dir, fname)
-                try:
-                    with open(fpath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    presets.append({
-                        'name': name,
-                        'label': name,
-                    })
-                except (json.JSONDecodeError, IOError):
-                    presets.append({'name': name, 'label': name})
-    return JsonResponse({'presets': presets})
+
+    def build():
+        try:
+            with os.scandir(models_dir) as it:
+                fnames = sorted(e.name for e in it
+                                if e.name.endswith('.json') and not e.name.endswith('.scene.json'))
+        except OSError:
+            fnames = []
+        return {'presets': [{'name': f[:-5], 'label': f[:-5]} for f in fnames]}
+
+    return HttpResponse(_cached_dir_listing('models', models_dir, build),
+                        content_type='application/json')
 
 
 @require_GET
@@ -1862,9 +2643,7 @@ def character_model_detail(request, name):
         return JsonResponse({'error': 'Invalid path'}, status=400)
     if not os.path.isfile(fpath):
         return HttpResponseNotFound(f'Preset not found: {name}')
-    with open(fpath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return JsonResponse(data)
+    return _json_file_response(fpath)
 
 
 @csrf_exempt
@@ -1872,7 +2651,7 @@ def character_model_detail(request, name):
 def character_model_save(request):
     """Save a model preset JSON file."""
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -1882,7 +2661,7 @@ def character_model_save(request):
         return JsonResponse({'error': 'name and data required'}, status=400)
 
     # Sanitize filename: keep alphanumeric, spaces, hyphens, underscores
-    safe_name = re.sub(r'[^\w\s\-]', '', name).strip()
+    safe_name = _safe_name(name)
     if not safe_name:
         return JsonResponse({'error': 'Invalid name'}, status=400)
 
@@ -1898,8 +2677,7 @@ def character_model_save(request):
     # Ensure 'name' field in data matches the filename
     data['name'] = safe_name
 
-    with open(fpath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json_file(fpath, data)
 
     return JsonResponse({'ok': True, 'filename': f"{safe_name}.json"})
 
@@ -1919,8 +2697,8 @@ def humanbody_settings_api(request):
         'default_anim_config': s.default_anim_config,
         'default_anim_scene': s.default_anim_scene,
         'default_anim_animations': s.default_anim_animations,
-        'expanded_panels_config': json.loads(s.expanded_panels_config or '[]'),
-        'expanded_panels_scene': json.loads(s.expanded_panels_scene or '[]'),
+        'expanded_panels_config': s.expanded_panels_config_list,
+        'expanded_panels_scene': s.expanded_panels_scene_list,
         'selection_opacity': s.selection_opacity,
         'result': s.default_model_result,
         'default_anim_result': s.default_anim_result,
@@ -1934,7 +2712,7 @@ def ui_pref_save(request):
     if request.method != 'POST':
         return JsonResponse({'error': 'POST required'}, status=405)
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
         key = data.get('key')
         value = data.get('value')
         if not key:
@@ -1983,7 +2761,7 @@ def smpl_settings_api(request):
 def smpl_settings_save(request):
     """Save SMPL body + scene settings from the test-smpl page."""
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, TypeError):
         return JsonResponse({'ok': False, 'error': 'Invalid JSON'}, status=400)
 
@@ -2033,11 +2811,7 @@ def character_bvh_file_cat(request, category, name):
         return HttpResponseNotFound('Invalid path')
     if not os.path.isfile(bvh_path):
         return HttpResponseNotFound(f'BVH not found: {category}/{name}')
-    return FileResponse(
-        open(bvh_path, 'rb'),
-        content_type='text/plain',
-        filename=f'{name}.bvh',
-    )
+    return _send_file(request, bvh_path, 'text/plain', f'{name}.bvh')
 
 
 @csrf_exempt
@@ -2045,7 +2819,7 @@ def character_bvh_file_cat(request, category, name):
 def animation_save(request):
     """Save a BVH animation file to its category directory."""
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -2083,7 +2857,7 @@ def animation_save(request):
 
 @require_GET
 def character_cloth(request):
-    """Generate a cloth mesh and return as base64 binary.
+    """Generate a cloth mesh and return as base64 binary (``binary=1``: _pack_arrays blob).
 
     Query params (common):
         body_type, gender, morph_*
@@ -2101,19 +2875,8 @@ def character_cloth(request):
     body_type = request.GET.get('body_type', 'Female_Caucasian')
     gender = _gender_from_body_type(body_type)
 
-    md = _get_morph_data()
-    cd = _get_char_defaults()
-
-    state = CharacterState(md, cd)
-    state.set_body_type(body_type)
-
-    for key, val in request.GET.items():
-        if key.startswith('morph_'):
-            morph_name = key[len('morph_'):]
-            try:
-                state.set_morph(morph_name, float(val))
-            except ValueError:
-                pass
+    morphs, _ = _morph_params(request.GET)
+    state = _character_state(body_type, morphs)
 
     vertices = state.compute()
     if vertices is None:
@@ -2150,34 +2913,40 @@ def character_cloth(request):
     if result is None:
         return JsonResponse({'error': 'Failed to generate cloth'}, status=400)
 
-    response_data = {
-        'vertex_count': int(result['vertices'].shape[0]),
-        'vertices': base64.b64encode(
-            result['vertices'].tobytes()).decode('ascii'),
-        'face_count': int(result['faces'].shape[0]),
-        'faces': base64.b64encode(
-            result['faces'].ravel().astype(np.uint32).tobytes()).decode('ascii'),
-        'normals': base64.b64encode(
-            result['normals'].tobytes()).decode('ascii'),
-        'color': list(result['color']),
-    }
-
     # Compute skin weights for cloth vertices (nearest body vertex)
+    cloth_si = cloth_sw = None
     skin_arrays = _get_base_skin_arrays(gender)
     if skin_arrays is not None:
-        from scipy.spatial import cKDTree
         body_si, body_sw = skin_arrays
-        tree = cKDTree(vertices)
+        tree = _body_tree(vertices)
         cloth_verts = result['vertices']
         _, nearest = tree.query(cloth_verts)
         cloth_si = body_si[nearest]   # (n_cloth, 4) float32
         cloth_sw = body_sw[nearest]   # (n_cloth, 4) float32
-        response_data['skin_indices'] = base64.b64encode(
-            cloth_si.tobytes()).decode('ascii')
-        response_data['skin_weights'] = base64.b64encode(
-            cloth_sw.tobytes()).decode('ascii')
 
-    return JsonResponse(response_data)
+    if request.GET.get('binary') in ('1', 'true'):
+        data = _pack_arrays([
+            ('vertices', result['vertices'].astype(np.float32, copy=False)),
+            ('faces', result['faces'].astype(np.uint32, copy=False)),
+            ('normals', result['normals'].astype(np.float32, copy=False)),
+            ('skin_indices', cloth_si),
+            ('skin_weights', cloth_sw),
+        ], {'color': list(result['color'])})
+        return HttpResponse(data, content_type='application/octet-stream')
+
+    response_data = {
+        'vertex_count': int(result['vertices'].shape[0]),
+        'vertices': _b64_array(result['vertices']),
+        'face_count': int(result['faces'].shape[0]),
+        'faces': _b64_array(result['faces'], np.uint32),
+        'normals': _b64_array(result['normals']),
+        'color': list(result['color']),
+    }
+    if cloth_si is not None:
+        response_data['skin_indices'] = _b64_array(cloth_si)
+        response_data['skin_weights'] = _b64_array(cloth_sw)
+
+    return _fast_json_response(response_data)
 
 
 @require_GET
@@ -2215,6 +2984,9 @@ HAIR_COLORS = {
     "Plum":               {"viewport": (0.33, 0.17, 0.05)},
 }
 
+# Viewport colours as sent by character_hairstyles (static, built once)
+_HAIR_COLOR_VIEWPORTS = {k: v['viewport'] for k, v in HAIR_COLORS.items()}
+
 
 # =========================================================================
 # Cloth Template Presets
@@ -2226,6 +2998,42 @@ _TPL_CATEGORY = {
 }
 
 
+_UNSAFE_NAME_RE = re.compile(r'[^\w\s\-]')
+# Same filter as a str.translate table for pure-ASCII names (derived from the
+# regex itself, so both paths always agree)
+_UNSAFE_ASCII_DEL = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _UNSAFE_NAME_RE.match(c)))
+
+
+def _safe_name(name):
+    """Strip everything but word chars, whitespace and hyphens from a name."""
+    if name.isascii():
+        return name.translate(_UNSAFE_ASCII_DEL).strip()
+    return _UNSAFE_NAME_RE.sub('', name).strip()
+
+
+@functools.lru_cache(maxsize=64)
+def _normpath_cached(path):
+    return os.path.normpath(path)
+
+
+def _path_in_dir(base, filename):
+    """Normalized ``base/filename``, or None if it would escape ``base``.
+
+    The normalized base is memoized (these dirs come from settings); the
+    containment check is component-wise (commonpath), so ``/x/hair2`` no
+    longer passes as inside ``/x/hair``.
+    """
+    base = _normpath_cached(base)
+    path = os.path.normpath(os.path.join(base, filename))
+    try:
+        if os.path.commonpath([path, base]) != base:
+            return None
+    except ValueError:  # different drives (Windows)
+        return None
+    return path
+
+
 def _cloth_preset_dir(category):
     """Return Path for cloth template preset directory, creating if needed."""
     d = settings.HUMANBODY_ASSETS_INSTANCE_DIR / category / 'clothFromTemplate'
@@ -2240,14 +3048,19 @@ def cloth_preset_list(request):
     if category not in ('Top', 'Pants'):
         return JsonResponse({'error': 'category must be Top or Pants'}, status=400)
     d = _cloth_preset_dir(category)
-    presets = []
-    for f in sorted(d.glob('*.json')):
-        try:
-            data = json.loads(f.read_text(encoding='utf-8'))
-            presets.append({'name': f.stem, 'label': data.get('name', f.stem)})
-        except (json.JSONDecodeError, IOError):
-            presets.append({'name': f.stem, 'label': f.stem})
-    return JsonResponse({'presets': presets})
+
+    def build():
+        presets = []
+        for f in sorted(d.glob('*.json')):
+            try:
+                data = json.loads(f.read_text(encoding='utf-8'))
+                presets.append({'name': f.stem, 'label': data.get('name', f.stem)})
+            except (json.JSONDecodeError, IOError):
+                presets.append({'name': f.stem, 'label': f.stem})
+        return {'presets': presets}
+
+    return HttpResponse(_cached_dir_listing(('cloth_presets', category), d, build),
+                        content_type='application/json')
 
 
 @csrf_exempt
@@ -2255,7 +3068,7 @@ def cloth_preset_list(request):
 def cloth_preset_save(request):
     """Save a cloth template preset."""
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -2269,18 +3082,17 @@ def cloth_preset_save(request):
     if not category:
         return JsonResponse({'error': f'Unknown template: {template}'}, status=400)
 
-    safe_name = re.sub(r'[^\w\s\-]', '', name).strip()
+    safe_name = _safe_name(name)
     if not safe_name:
         return JsonResponse({'error': 'Invalid name'}, status=400)
 
-    d = _cloth_preset_dir(category)
-    fpath = os.path.normpath(os.path.join(str(d), f"{safe_name}.json"))
-    if not fpath.startswith(os.path.normpath(str(d))):
+    fpath = _path_in_dir(str(_cloth_preset_dir(category)), f"{safe_name}.json")
+    if fpath is None:
         return JsonResponse({'error': 'Invalid path'}, status=400)
 
     data['name'] = name
-    with open(fpath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Atomic replace also bumps the directory mtime → cloth_preset_list rebuilds
+    _write_json_file(fpath, data)
 
     return JsonResponse({'ok': True, 'filename': f"{safe_name}.json", 'category': category})
 
@@ -2293,16 +3105,13 @@ def cloth_preset_detail(request, category, name):
     if '/' in name or '\\' in name or '..' in name:
         return JsonResponse({'error': 'Invalid name'}, status=400)
 
-    d = _cloth_preset_dir(category)
-    fpath = os.path.normpath(os.path.join(str(d), f"{name}.json"))
-    if not fpath.startswith(os.path.normpath(str(d))):
+    fpath = _path_in_dir(str(_cloth_preset_dir(category)), f"{name}.json")
+    if fpath is None:
         return JsonResponse({'error': 'Invalid path'}, status=400)
     if not os.path.isfile(fpath):
         return HttpResponseNotFound(f'Preset not found: {category}/{name}')
 
-    with open(fpath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return JsonResponse(data)
+    return _json_file_response(fpath)
 
 
 # =========================================================================
@@ -2314,25 +3123,7 @@ def _build_body_state(request):
     body_type = request.GET.get('body_type', 'Female_Caucasian')
     gender = _gender_from_body_type(body_type)
 
-    md = _get_morph_data()
-    cd = _get_char_defaults()
-
-    state = CharacterState(md, cd)
-    state.set_body_type(body_type)
-
-    for key, val in request.GET.items():
-        if key.startswith('morph_'):
-            morph_name = key[len('morph_'):]
-            try:
-                state.set_morph(morph_name, float(val))
-            except ValueError:
-                pass
-        elif key.startswith('meta_'):
-            meta_name = key[len('meta_'):]
-            try:
-                state.set_meta(meta_name, float(val))
-            except (ValueError, AttributeError):
-                pass
+    state = _character_state(body_type, *_morph_params(request.GET))
 
     vertices = state.compute()
     mesh = _get_mesh_data(gender)
@@ -2353,7 +3144,7 @@ def pattern_generate(request):
     Query params: body_type, morph_* for body state.
     """
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON body'}, status=400)
 
@@ -2390,32 +3181,26 @@ def pattern_generate(request):
 
     response_data = {
         'vertex_count': int(result['vertices'].shape[0]),
-        'vertices': base64.b64encode(
-            result['vertices'].tobytes()).decode('ascii'),
+        'vertices': _b64_array(result['vertices']),
         'face_count': int(result['faces'].shape[0]),
-        'faces': base64.b64encode(
-            result['faces'].ravel().astype(np.uint32).tobytes()).decode('ascii'),
-        'normals': base64.b64encode(
-            result['normals'].tobytes()).decode('ascii'),
+        'faces': _b64_array(result['faces'], np.uint32),
+        'normals': _b64_array(result['normals']),
         'color': list(result['color']),
     }
 
     # Add skin weights
     skin_arrays = _get_base_skin_arrays(gender)
     if skin_arrays is not None:
-        from scipy.spatial import cKDTree
         body_si, body_sw = skin_arrays
-        tree = cKDTree(vertices)
+        tree = _body_tree(vertices)
         cloth_verts = result['vertices']
         _, nearest = tree.query(cloth_verts)
         cloth_si = body_si[nearest]
         cloth_sw = body_sw[nearest]
-        response_data['skin_indices'] = base64.b64encode(
-            cloth_si.tobytes()).decode('ascii')
-        response_data['skin_weights'] = base64.b64encode(
-            cloth_sw.tobytes()).decode('ascii')
+        response_data['skin_indices'] = _b64_array(cloth_si)
+        response_data['skin_weights'] = _b64_array(cloth_sw)
 
-    return JsonResponse(response_data)
+    return _fast_json_response(response_data)
 
 
 @csrf_exempt
@@ -2427,7 +3212,7 @@ def pattern_save(request):
     Query params: body_type, morph_* for body state.
     """
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON body'}, status=400)
 
@@ -2618,52 +3403,56 @@ def pattern_region_generate(request):
 
     response_data = {
         'vertex_count': int(result['vertices'].shape[0]),
-        'vertices': base64.b64encode(
-            result['vertices'].tobytes()).decode('ascii'),
+        'vertices': _b64_array(result['vertices']),
         'face_count': int(result['faces'].shape[0]),
-        'faces': base64.b64encode(
-            result['faces'].ravel().astype(np.uint32).tobytes()).decode('ascii'),
-        'normals': base64.b64encode(
-            result['normals'].tobytes()).decode('ascii'),
+        'faces': _b64_array(result['faces'], np.uint32),
+        'normals': _b64_array(result['normals']),
         'color': list(result['color']),
     }
 
     skin_arrays = _get_base_skin_arrays(gender)
     if skin_arrays is not None:
-        from scipy.spatial import cKDTree
         body_si, body_sw = skin_arrays
-        tree = cKDTree(vertices)
+        tree = _body_tree(vertices)
         cloth_verts = result['vertices']
         _, nearest = tree.query(cloth_verts)
         cloth_si = body_si[nearest]
         cloth_sw = body_sw[nearest]
-        response_data['skin_indices'] = base64.b64encode(
-            cloth_si.tobytes()).decode('ascii')
-        response_data['skin_weights'] = base64.b64encode(
-            cloth_sw.tobytes()).decode('ascii')
+        response_data['skin_indices'] = _b64_array(cloth_si)
+        response_data['skin_weights'] = _b64_array(cloth_sw)
 
-    return JsonResponse(response_data)
+    return _fast_json_response(response_data)
 
 
 @require_GET
 def character_hairstyles(request):
     """Return available hairstyles (GLB files in hairstyles dir)."""
     hairstyles_dir = os.path.join(str(settings.HUMANBODY_DATA_DIR), 'hairstyles')
-    styles = []
-    if os.path.isdir(hairstyles_dir):
-        for fname in sorted(os.listdir(hairstyles_dir)):
-            if fname.endswith('.glb'):
-                name = fname[:-4]
-                label = name.replace('_', ' ').title()
-                styles.append({
-                    'name': name,
-                    'label': label,
-                    'url': f'/api/character/hairstyle/{name}/',
-                })
-    return JsonResponse({
-        'hairstyles': styles,
-        'colors': {k: v['viewport'] for k, v in HAIR_COLORS.items()},
-    })
+
+    def build():
+        styles = []
+        try:
+            # scandir's cached entry type spares a stat per file; only .glb names are sorted
+            with os.scandir(hairstyles_dir) as it:
+                fnames = [e.name for e in it if e.name.endswith('.glb') and e.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            fnames = []
+        fnames.sort()
+        for fname in fnames:
+            name = fname[:-4]
+            label = name.replace('_', ' ').title()
+            styles.append({
+                'name': name,
+                'label': label,
+                'url': f'/api/character/hairstyle/{name}/',
+            })
+        return {
+            'hairstyles': styles,
+            'colors': _HAIR_COLOR_VIEWPORTS,
+        }
+
+    return HttpResponse(_cached_dir_listing('hairstyles', hairstyles_dir, build),
+                        content_type='application/json')
 
 
 def character_hairstyle_glb(request, name):
@@ -2671,22 +3460,37 @@ def character_hairstyle_glb(request, name):
     if '/' in name or '\\' in name or '..' in name:
         return JsonResponse({'error': 'Invalid name'}, status=400)
     hairstyles_dir = os.path.join(str(settings.HUMANBODY_DATA_DIR), 'hairstyles')
-    glb_path = os.path.normpath(os.path.join(hairstyles_dir, f"{name}.glb"))
-    if not glb_path.startswith(os.path.normpath(hairstyles_dir)):
+    glb_path = _path_in_dir(hairstyles_dir, f"{name}.glb")
+    if glb_path is None:
         return JsonResponse({'error': 'Invalid path'}, status=400)
     if not os.path.isfile(glb_path):
         return HttpResponseNotFound(f'Hairstyle not found: {name}')
-    return FileResponse(
-        open(glb_path, 'rb'),
-        content_type='model/gltf-binary',
-        filename=f'{name}.glb',
-    )
+    return _send_file(request, glb_path, 'model/gltf-binary', f'{name}.glb')
 
 
 # =========================================================================
 # Photo To 3D — page + SMPLest-X analysis API
 # =========================================================================
 
+_WRAPPERS_DIR = os.path.join(str(settings.BASE_DIR), '..', 'VideoToBVH', 'wrappers')
+
+
+def _import_wrapper(name):
+    """Import a VideoToBVH wrapper module (smplest_x_wrapper, photo_analyzer).
+
+    The wrappers dir is appended to sys.path once and stays there (last, so
+    it can't shadow installed packages); later calls are a sys.modules
+    lookup. Returns None if the module can't be imported — other errors
+    raised while the module initializes propagate to the caller.
+    """
+    if _WRAPPERS_DIR not in sys.path:
+        sys.path.append(_WRAPPERS_DIR)
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
 def _detect_skin_color(image_path):
     """Detect dominant skin color from a photo using HSV filtering.
 
@@ -2757,22 +3561,17 @@ def photo_analysis_job_data(request, job_id):
 
     # Re-compute morph mapping from stored betas for latest mapping quality
     if data.get('betas'):
-        import sys
-        wrappers_dir = os.path.join(str(settings.BASE_DIR), '..', 'VideoToBVH', 'wrappers')
-        sys.path.insert(0, wrappers_dir)
         try:
-            from smplest_x_wrapper import betas_to_morph_sliders
-            mapping = betas_to_morph_sliders(
-                data['betas'], data.get('gender', 'female'),
-                expression=data.get('expression'))
-            data['morphs'] = mapping['morphs']
-            data['meta_sliders'] = mapping['meta_sliders']
-            data['body_type'] = mapping['body_type']
+            smplx = _import_wrapper('smplest_x_wrapper')
+            if smplx is not None:
+                mapping = smplx.betas_to_morph_sliders(
+                    data['betas'], data.get('gender', 'female'),
+                    expression=data.get('expression'))
+                data['morphs'] = mapping['morphs']
+                data['meta_sliders'] = mapping['meta_sliders']
+                data['body_type'] = mapping['body_type']
         except Exception:
             pass  # Fall back to cached data
-        finally:
-            if wrappers_dir in sys.path:
-                sys.path.remove(wrappers_dir)
 
     # Add convenient URLs for frontend
     data['ok'] = True
@@ -2784,7 +3583,7 @@ def photo_analysis_job_data(request, job_id):
     if job.result_image:
         data['result_image_url'] = f'/{job.result_image}'
 
-    return JsonResponse(data)
+    return _fast_json_response(data)
 
 
 @csrf_exempt
@@ -2799,7 +3598,7 @@ def photo_analysis_save_screenshot(request, job_id):
 
     import base64
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'ok': False, 'error': 'Invalid JSON'}, status=400)
 
@@ -2842,7 +3641,7 @@ def photo_save_projection(request, job_id):
 
     import base64
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'ok': False, 'error': 'Invalid JSON'}, status=400)
 
@@ -2918,7 +3717,7 @@ def photo_analysis_bulk_delete(request):
     """Delete multiple photo analysis jobs at once."""
     from .models import PhotoAnalysisJob
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
         job_ids = data.get('ids', [])
     except (json.JSONDecodeError, TypeError):
         return JsonResponse({'ok': False, 'error': 'Invalid JSON'}, status=400)
@@ -2965,20 +3764,16 @@ def _compute_auto_alignment(cam_data, betas, gender, photo_path=None):
 
     Returns dict with 'body_transform' key, or None if cam_data is incomplete.
     """
-    import sys
     import numpy as np
 
     # Generate SMPL-X mesh to get mesh center (cx, cy) and base_scale
-    wrappers_dir = os.path.join(str(settings.BASE_DIR), '..', 'VideoToBVH', 'wrappers')
-    sys.path.insert(0, wrappers_dir)
+    smplx = _import_wrapper('smplest_x_wrapper')
+    if smplx is None:
+        return None
     try:
-        from smplest_x_wrapper import generate_mesh
-        mesh = generate_mesh(betas, gender)
+        mesh = smplx.generate_mesh(betas, gender)
     except ImportError:
         return None
-    finally:
-        if wrappers_dir in sys.path:
-            sys.path.remove(wrappers_dir)
 
     if mesh is None:
         return None
@@ -3148,15 +3943,12 @@ def analyze_photo(request):
     Expects multipart form with 'photo' file and optional 'backend' field.
     Returns JSON with detected body type, meta sliders, and morph values.
     """
-    import sys
-    wrappers_dir = os.path.join(str(settings.BASE_DIR), '..', 'VideoToBVH', 'wrappers')
-    if wrappers_dir not in sys.path:
-        sys.path.insert(0, wrappers_dir)
-    try:
-        from photo_analyzer import analyze as pa_analyze
-        from smplest_x_wrapper import betas_to_morph_sliders
-    except ImportError:
+    photo_analyzer = _import_wrapper('photo_analyzer')
+    smplx = _import_wrapper('smplest_x_wrapper')
+    if photo_analyzer is None or smplx is None:
         return JsonResponse({'ok': False, 'error': 'Photo analyzer not found'})
+    pa_analyze = photo_analyzer.analyze
+    betas_to_morph_sliders = smplx.betas_to_morph_sliders
 
     photo = request.FILES.get('photo')
     if not photo:
@@ -3172,9 +3964,7 @@ def analyze_photo(request):
     filename = f"{uuid.uuid4().hex}{ext}"
     filepath = os.path.join(upload_dir, filename)
 
-    with open(filepath, 'wb') as f:
-        for chunk in photo.chunks():
-            f.write(chunk)
+    _save_upload(photo, filepath)
 
     # Analyze with selected backend
     import time as _time
@@ -3292,31 +4082,23 @@ def analyze_photo(request):
                     logger.error('Failed to load posed vertices from %s', posed_path)
 
             # NPZ with generated mesh + rig
-            import sys as _sys
-            _wd = os.path.join(str(settings.BASE_DIR), '..', 'VideoToBVH', 'wrappers')
-            _sys.path.insert(0, _wd)
-            try:
-                from smplest_x_wrapper import generate_mesh
-                mesh = generate_mesh(result['betas'], effective_gender)
-                if mesh is not None:
-                    npz_path = os.path.join(smplx_dir, f'{job_obj.id}.npz')
-                    npz_data = dict(
-                        vertices=mesh['vertices'],
-                        faces=mesh['faces'],
-                        joints=mesh['joints'],
-                        parents=np.array(mesh['parents'], dtype=np.int32),
-                        skin_indices=mesh['skin_indices'],
-                        skin_weights=mesh['skin_weights'],
-                        betas=np.array(result['betas'], dtype=np.float32),
-                        expression=np.array(result.get('expression', []),
-                                            dtype=np.float32),
-                    )
-                    if posed_vertices is not None:
-                        npz_data['posed_vertices'] = posed_vertices.astype(np.float32)
-                    np.savez_compressed(npz_path, **npz_data)
-            finally:
-                if _wd in _sys.path:
-                    _sys.path.remove(_wd)
+            mesh = smplx.generate_mesh(result['betas'], effective_gender)
+            if mesh is not None:
+                npz_path = os.path.join(smplx_dir, f'{job_obj.id}.npz')
+                npz_data = dict(
+                    vertices=mesh['vertices'],
+                    faces=mesh['faces'],
+                    joints=mesh['joints'],
+                    parents=np.array(mesh['parents'], dtype=np.int32),
+                    skin_indices=mesh['skin_indices'],
+                    skin_weights=mesh['skin_weights'],
+                    betas=np.array(result['betas'], dtype=np.float32),
+                    expression=np.array(result.get('expression', []),
+                                        dtype=np.float32),
+                )
+                if posed_vertices is not None:
+                    npz_data['posed_vertices'] = posed_vertices.astype(np.float32)
+                np.savez_compressed(npz_path, **npz_data)
         except Exception as exc:
             logger.error('Failed to save SMPL-X output: %s', exc)
 
@@ -3347,23 +4129,17 @@ def analyze_photo(request):
         except Exception as exc:
             logger.error('Auto-alignment failed: %s', exc)
 
-    return JsonResponse(resp)
+    return _fast_json_response(resp)
 
 
 @require_GET
 def analyze_photo_status(request):
     """Return status of all photo analysis backends."""
-    import sys
-    wrappers_dir = os.path.join(str(settings.BASE_DIR), '..', 'VideoToBVH', 'wrappers')
-    sys.path.insert(0, wrappers_dir)
     try:
-        from photo_analyzer import get_all_status
-        backends = get_all_status()
+        photo_analyzer = _import_wrapper('photo_analyzer')
+        backends = photo_analyzer.get_all_status() if photo_analyzer is not None else {}
     except ImportError:
         backends = {}
-    finally:
-        if wrappers_dir in sys.path:
-            sys.path.remove(wrappers_dir)
 
     return JsonResponse({'backends': backends})
 
@@ -3375,20 +4151,17 @@ def smplx_mesh(request):
 
     Expects JSON: {"betas": [...], "gender": "female"|"male"|"neutral"}
     Returns base64-encoded vertices (float32) and faces (uint32).
+    With ``binary=1`` (query param or ``"binary": true`` in the body) the
+    arrays come as one _pack_arrays blob instead (``parents`` as an int32
+    section, counts in the meta JSON).
     """
-    import sys
-    wrappers_dir = os.path.join(str(settings.BASE_DIR), '..', 'VideoToBVH', 'wrappers')
-    sys.path.insert(0, wrappers_dir)
-    try:
-        from smplest_x_wrapper import generate_mesh
-    except ImportError:
+    smplx = _import_wrapper('smplest_x_wrapper')
+    if smplx is None:
         return JsonResponse({'ok': False, 'error': 'Wrapper not found'})
-    finally:
-        if wrappers_dir in sys.path:
-            sys.path.remove(wrappers_dir)
+    generate_mesh = smplx.generate_mesh
 
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'ok': False, 'error': 'Invalid JSON'}, status=400)
 
@@ -3399,14 +4172,30 @@ def smplx_mesh(request):
     if result is None:
         return JsonResponse({'ok': False, 'error': 'SMPL-X model not available'})
 
+    if request.GET.get('binary') in ('1', 'true') or body.get('binary') is True:
+        has_uv = 'uv_coords' in result
+        meta = {'ok': True, 'n_verts': int(result['n_verts']),
+                'n_faces': int(result['n_faces']), 'n_joints': int(result['n_joints'])}
+        if has_uv:
+            meta['n_uv_verts'] = int(result['n_uv_verts'])
+        uv_names = ('uv_vertices', 'uv_coords', 'uv_faces',
+                    'uv_skin_indices', 'uv_skin_weights')
+        data = _pack_arrays(
+            [(name, result[name]) for name in
+             ('vertices', 'faces', 'joints', 'skin_indices', 'skin_weights')]
+            + [('parents', np.asarray(result['parents'], dtype=np.int32))]
+            + [(name, result[name] if has_uv else None) for name in uv_names],
+            meta)
+        return HttpResponse(data, content_type='application/octet-stream')
+
     resp = {
         'ok': True,
-        'vertices': base64.b64encode(result['vertices'].tobytes()).decode(),
-        'faces': base64.b64encode(result['faces'].tobytes()).decode(),
-        'joints': base64.b64encode(result['joints'].tobytes()).decode(),
+        'vertices': _b64_array(result['vertices']),
+        'faces': _b64_array(result['faces']),
+        'joints': _b64_array(result['joints']),
         'parents': result['parents'],
-        'skin_indices': base64.b64encode(result['skin_indices'].tobytes()).decode(),
-        'skin_weights': base64.b64encode(result['skin_weights'].tobytes()).decode(),
+        'skin_indices': _b64_array(result['skin_indices']),
+        'skin_weights': _b64_array(result['skin_weights']),
         'n_verts': result['n_verts'],
         'n_faces': result['n_faces'],
         'n_joints': result['n_joints'],
@@ -3414,14 +4203,14 @@ def smplx_mesh(request):
 
     # Include UV data if available (seam-duplicated vertex arrays)
     if 'uv_coords' in result:
-        resp['uv_vertices']     = base64.b64encode(result['uv_vertices'].tobytes()).decode()
-        resp['uv_coords']       = base64.b64encode(result['uv_coords'].tobytes()).decode()
-        resp['uv_faces']        = base64.b64encode(result['uv_faces'].tobytes()).decode()
-        resp['uv_skin_indices'] = base64.b64encode(result['uv_skin_indices'].tobytes()).decode()
-        resp['uv_skin_weights'] = base64.b64encode(result['uv_skin_weights'].tobytes()).decode()
+        resp['uv_vertices']     = _b64_array(result['uv_vertices'])
+        resp['uv_coords']       = _b64_array(result['uv_coords'])
+        resp['uv_faces']        = _b64_array(result['uv_faces'])
+        resp['uv_skin_indices'] = _b64_array(result['uv_skin_indices'])
+        resp['uv_skin_weights'] = _b64_array(result['uv_skin_weights'])
         resp['n_uv_verts']      = result['n_uv_verts']
 
-    return JsonResponse(resp)
+    return _fast_json_response(resp)
 
 
 def _auto_body_transform(vertices, posed_proj, w_img, h_img, margin=0.05):
@@ -3534,16 +4323,13 @@ def smplx_texture(request, job_id):
     gender = data.get('gender', 'neutral')
 
     # Generate SMPL-X mesh
-    wrappers_dir = os.path.join(str(settings.BASE_DIR), '..', 'VideoToBVH', 'wrappers')
-    sys.path.insert(0, wrappers_dir)
+    smplx = _import_wrapper('smplest_x_wrapper')
+    if smplx is None:
+        return JsonResponse({'ok': False, 'error': 'Wrapper not found'}, status=500)
     try:
-        from smplest_x_wrapper import generate_mesh
-        mesh = generate_mesh(betas, gender)
+        mesh = smplx.generate_mesh(betas, gender)
     except ImportError:
         return JsonResponse({'ok': False, 'error': 'Wrapper not found'}, status=500)
-    finally:
-        if wrappers_dir in sys.path:
-            sys.path.remove(wrappers_dir)
 
     if mesh is None:
         return JsonResponse({'ok': False, 'error': 'SMPL-X model not available'}, status=500)
@@ -3691,7 +4477,6 @@ def photo_silhouette_data(request, job_id):
     photo dimensions, rasterises front-facing triangles to extract body contour,
     and computes face contour from face vertex indices.
     """
-    import sys
     import cv2
 
     from .models import PhotoAnalysisJob
@@ -3718,16 +4503,13 @@ def photo_silhouette_data(request, job_id):
     h_img, w_img = photo.shape[:2]
 
     # Generate SMPL-X mesh
-    wrappers_dir = os.path.join(str(settings.BASE_DIR), '..', 'VideoToBVH', 'wrappers')
-    sys.path.insert(0, wrappers_dir)
+    smplx = _import_wrapper('smplest_x_wrapper')
+    if smplx is None:
+        return JsonResponse({'ok': False, 'error': 'Wrapper not found'}, status=500)
     try:
-        from smplest_x_wrapper import generate_mesh
-        mesh = generate_mesh(betas, gender)
+        mesh = smplx.generate_mesh(betas, gender)
     except ImportError:
         return JsonResponse({'ok': False, 'error': 'Wrapper not found'}, status=500)
-    finally:
-        if wrappers_dir in sys.path:
-            sys.path.remove(wrappers_dir)
 
     if mesh is None:
         return JsonResponse({'ok': False, 'error': 'SMPL-X model not available'}, status=500)
@@ -4036,7 +4818,7 @@ def photo_save_alignment(request, job_id):
         return JsonResponse({'ok': False, 'error': 'Job not found'}, status=404)
 
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'ok': False, 'error': 'Invalid JSON'}, status=400)
 
@@ -4130,17 +4912,7 @@ def mh_proxy_fit(request):
     gender = _gender_from_body_type(body_type)
 
     # Get body vertices
-    md = _get_morph_data()
-    cd = _get_char_defaults()
-    state = CharacterState(md, cd)
-    state.set_body_type(body_type)
-    for key, val in request.GET.items():
-        if key.startswith('morph_'):
-            try: state.set_morph(key[6:], float(val))
-            except (ValueError, AttributeError): pass
-        if key.startswith('meta_'):
-            try: state.set_meta(key[5:], float(val))
-            except (ValueError, AttributeError): pass
+    state = _character_state(body_type, *_morph_params(request.GET))
 
     body_verts = state.compute()
     if body_verts is None:
@@ -4281,13 +5053,13 @@ def mh_proxy_fit(request):
 
     resp = {
         'vertex_count': int(len(garment_verts)),
-        'vertices': base64.b64encode(verts_f32.tobytes()).decode(),
-        'normals': base64.b64encode(normals_f32.tobytes()).decode(),
-        'faces': base64.b64encode(tris_u32.tobytes()).decode(),
-        'skin_indices': base64.b64encode(
+        'vertices': _b64_array(verts_f32),
+        'normals': _b64_array(normals_f32),
+        'faces': _b64_array(tris_u32),
+        'skin_indices': _b64encode(
             _compute_garment_skin_indices(garment_verts, body_verts, gender)
         ).decode() if hasattr(garment_verts, 'shape') else '',
-        'skin_weights': base64.b64encode(
+        'skin_weights': _b64encode(
             _compute_garment_skin_weights(garment_verts, body_verts, gender)
         ).decode() if hasattr(garment_verts, 'shape') else '',
     }
@@ -4316,7 +5088,7 @@ def mh_proxy_fit(request):
                             except: pass
                         break
         except: pass
-    return JsonResponse(resp)
+    return _fast_json_response(resp)
 
 
 def _tpose_to_apose(garment_verts, body_verts, gender='female'):
@@ -4417,11 +5189,11 @@ def _compute_garment_skin_indices(garment_verts, body_verts, gender='female', re
         ref_tree = cKDTree(ref_body)
         _, nearest_ref = ref_tree.query(garment_verts)
         # Map ref_body positions to nearest Rigify body positions
-        body_tree = cKDTree(body_verts)
+        body_tree = _body_tree(body_verts)
         _, ref_to_body = body_tree.query(ref_body)
         nearest = ref_to_body[nearest_ref]
     else:
-        tree = cKDTree(body_verts)
+        tree = _body_tree(body_verts)
         _, nearest = tree.query(garment_verts)
     return si[nearest].astype(np.float32).tobytes()
 
@@ -4433,11 +5205,11 @@ def _compute_garment_skin_weights(garment_verts, body_verts, gender='female', re
     if ref_body is not None and len(ref_body) != len(body_verts):
         ref_tree = cKDTree(ref_body)
         _, nearest_ref = ref_tree.query(garment_verts)
-        body_tree = cKDTree(body_verts)
+        body_tree = _body_tree(body_verts)
         _, ref_to_body = body_tree.query(ref_body)
         nearest = ref_to_body[nearest_ref]
     else:
-        tree = cKDTree(body_verts)
+        tree = _body_tree(body_verts)
         _, nearest = tree.query(garment_verts)
     return sw[nearest].astype(np.float32).tobytes()
 
@@ -4484,7 +5256,7 @@ def pose_manage(request):
         return JsonResponse({'error': 'POST required'}, status=405)
 
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -4540,7 +5312,7 @@ def tpose_vertices(request):
         return JsonResponse({'error': 'T-pose vertices not found'}, status=404)
     verts = np.load(tpose_path).astype(np.float32)
     return JsonResponse({
-        'vertices': base64.b64encode(verts.tobytes()).decode(),
+        'vertices': _b64_array(verts),
         'vertex_count': int(len(verts)),
     })
 
@@ -4556,17 +5328,7 @@ def mh_push_outside(request):
     push_dist_mm = float(request.GET.get('push_dist', 3))
 
     # Get body
-    md = _get_morph_data()
-    cd = _get_char_defaults()
-    state = CharacterState(md, cd)
-    state.set_body_type(body_type)
-    for key, val in request.GET.items():
-        if key.startswith('morph_'):
-            try: state.set_morph(key[6:], float(val))
-            except: pass
-        if key.startswith('meta_'):
-            try: state.set_meta(key[5:], float(val))
-            except: pass
+    state = _character_state(body_type, *_morph_params(request.GET))
     body_verts = state.compute()
     if body_verts is None:
         return JsonResponse({'error': 'Body compute failed'}, status=500)
@@ -4591,7 +5353,7 @@ def mh_push_outside(request):
 
     # Parse garment vertices from POST
     try:
-        post_data = json.loads(request.body)
+        post_data = _loads_json(request.body)
         raw = base64.b64decode(post_data['vertices'])
         garment_verts = np.frombuffer(raw, dtype=np.float32).reshape(-1, 3).astype(np.float64)
     except Exception as e:
@@ -4609,7 +5371,7 @@ def mh_push_outside(request):
     )
 
     return JsonResponse({
-        'vertices': base64.b64encode(result.astype(np.float32).tobytes()).decode(),
+        'vertices': _b64_array(result, np.float32),
     })
 
 
@@ -4638,23 +5400,7 @@ def garment_fit(request):
     gender = _gender_from_body_type(body_type)
 
     # Compute morphed body vertices (same pattern as character_cloth)
-    md = _get_morph_data()
-    cd = _get_char_defaults()
-    state = CharacterState(md, cd)
-    state.set_body_type(body_type)
-
-    for key, val in request.GET.items():
-        if key.startswith('morph_'):
-            try:
-                state.set_morph(key[6:], float(val))
-            except ValueError:
-                pass
-    for key, val in request.GET.items():
-        if key.startswith('meta_'):
-            try:
-                state.set_meta(key[5:], float(val))
-            except (ValueError, AttributeError):
-                pass
+    state = _character_state(body_type, *_morph_params(request.GET))
 
     body_verts = state.compute()
     if body_verts is None:
@@ -4688,7 +5434,7 @@ def garment_fit(request):
         hull_verts = None
         if request.method == 'POST':
             try:
-                post_data = json.loads(request.body)
+                post_data = _loads_json(request.body)
                 hull_b64 = post_data.get('hull_vertices')
                 if hull_b64:
                     raw = base64.b64decode(hull_b64)
@@ -4739,13 +5485,10 @@ def garment_fit(request):
 
     response_data = {
         'vertex_count': int(result['vertices'].shape[0]),
-        'vertices': base64.b64encode(
-            result['vertices'].tobytes()).decode('ascii'),
+        'vertices': _b64_array(result['vertices']),
         'face_count': int(result['faces'].shape[0]),
-        'faces': base64.b64encode(
-            result['faces'].ravel().astype(np.uint32).tobytes()).decode('ascii'),
-        'normals': base64.b64encode(
-            result['normals'].tobytes()).decode('ascii'),
+        'faces': _b64_array(result['faces'], np.uint32),
+        'normals': _b64_array(result['normals']),
         'color': list(color),
         'garment_id': garment_id,
         'garment_name': template.name,
@@ -4754,18 +5497,15 @@ def garment_fit(request):
     # Skin weights (same pattern as character_cloth)
     skin_arrays = _get_base_skin_arrays(gender)
     if skin_arrays is not None:
-        from scipy.spatial import cKDTree
         body_si, body_sw = skin_arrays
-        tree = cKDTree(body_verts)
+        tree = _body_tree(body_verts)
         _, nearest = tree.query(result['vertices'])
         cloth_si = body_si[nearest]
         cloth_sw = body_sw[nearest]
-        response_data['skin_indices'] = base64.b64encode(
-            cloth_si.tobytes()).decode('ascii')
-        response_data['skin_weights'] = base64.b64encode(
-            cloth_sw.tobytes()).decode('ascii')
+        response_data['skin_indices'] = _b64_array(cloth_si)
+        response_data['skin_weights'] = _b64_array(cloth_sw)
 
-    return JsonResponse(response_data)
+    return _fast_json_response(response_data)
 
 
 @require_GET
@@ -4797,7 +5537,7 @@ def garment_download(request):
         asset_name — download a single built-in asset
     """
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -4833,7 +5573,7 @@ def garment_download(request):
 def garment_export(request):
     """Export a fitted garment to OBJ + weights files."""
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -4843,7 +5583,7 @@ def garment_export(request):
         return JsonResponse({'error': 'garment_id and name required'}, status=400)
 
     # Sanitize name
-    safe_name = re.sub(r'[^\w\s\-]', '', name).strip()
+    safe_name = _safe_name(name)
     if not safe_name:
         return JsonResponse({'error': 'Invalid name'}, status=400)
 
@@ -4968,9 +5708,9 @@ def smpl_body_mesh(request):
         return JsonResponse({'error': str(e)}, status=400)
 
     return JsonResponse({
-        'vertices': base64.b64encode(mesh['vertices'].tobytes()).decode(),
-        'faces': base64.b64encode(mesh['faces'].tobytes()).decode(),
-        'normals': base64.b64encode(mesh['normals'].tobytes()).decode(),
+        'vertices': _b64_array(mesh['vertices']),
+        'faces': _b64_array(mesh['faces']),
+        'normals': _b64_array(mesh['normals']),
         'vertex_count': mesh['vertex_count'],
         'face_count': mesh['face_count'],
         'gender': gender,
@@ -4982,7 +5722,7 @@ def smpl_garment_library(request):
     """Return SMPL garment catalog grouped by category."""
     lib = _get_smpl_library()
     catalog = lib.get_catalog()
-    return JsonResponse(catalog)
+    return _fast_json_response(catalog)
 
 
 @require_GET
@@ -5001,9 +5741,9 @@ def smpl_garment_mesh(request):
 
     return JsonResponse({
         'garment_id': garment_id,
-        'vertices': base64.b64encode(mesh['vertices'].tobytes()).decode(),
-        'faces': base64.b64encode(mesh['faces'].tobytes()).decode(),
-        'normals': base64.b64encode(mesh['normals'].tobytes()).decode(),
+        'vertices': _b64_array(mesh['vertices']),
+        'faces': _b64_array(mesh['faces']),
+        'normals': _b64_array(mesh['normals']),
         'vertex_count': len(mesh['vertices']) // 3,
         'face_count': len(mesh['faces']) // 3,
     })
@@ -5037,23 +5777,7 @@ def smpl_garment_fit(request):
     gender = _gender_from_body_type(body_type)
 
     # Compute morphed body vertices
-    md = _get_morph_data()
-    cd = _get_char_defaults()
-    state = CharacterState(md, cd)
-    state.set_body_type(body_type)
-
-    for key, val in request.GET.items():
-        if key.startswith('morph_'):
-            try:
-                state.set_morph(key[6:], float(val))
-            except ValueError:
-                pass
-    for key, val in request.GET.items():
-        if key.startswith('meta_'):
-            try:
-                state.set_meta(key[5:], float(val))
-            except (ValueError, AttributeError):
-                pass
+    state = _character_state(body_type, *_morph_params(request.GET))
 
     body_verts = state.compute()
     if body_verts is None:
@@ -5086,13 +5810,10 @@ def smpl_garment_fit(request):
 
     response_data = {
         'vertex_count': int(result['vertices'].shape[0]),
-        'vertices': base64.b64encode(
-            result['vertices'].tobytes()).decode('ascii'),
+        'vertices': _b64_array(result['vertices']),
         'face_count': int(result['faces'].shape[0]),
-        'faces': base64.b64encode(
-            result['faces'].ravel().astype(np.uint32).tobytes()).decode('ascii'),
-        'normals': base64.b64encode(
-            result['normals'].tobytes()).decode('ascii'),
+        'faces': _b64_array(result['faces'], np.uint32),
+        'normals': _b64_array(result['normals']),
         'color': list(color),
         'garment_id': garment_id,
     }
@@ -5100,18 +5821,15 @@ def smpl_garment_fit(request):
     # Skin weights
     skin_arrays = _get_base_skin_arrays(gender)
     if skin_arrays is not None:
-        from scipy.spatial import cKDTree
         body_si, body_sw = skin_arrays
-        tree = cKDTree(body_verts)
+        tree = _body_tree(body_verts)
         _, nearest = tree.query(result['vertices'])
         cloth_si = body_si[nearest]
         cloth_sw = body_sw[nearest]
-        response_data['skin_indices'] = base64.b64encode(
-            cloth_si.tobytes()).decode('ascii')
-        response_data['skin_weights'] = base64.b64encode(
-            cloth_sw.tobytes()).decode('ascii')
+        response_data['skin_indices'] = _b64_array(cloth_si)
+        response_data['skin_weights'] = _b64_array(cloth_sw)
 
-    return JsonResponse(response_data)
+    return _fast_json_response(response_data)
 
 
 @require_GET
@@ -5146,7 +5864,7 @@ def vertex_edit_smooth(request):
     Returns: {vertices (base64 Float32)} with only selected verts updated.
     """
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON body'}, status=400)
 
@@ -5176,7 +5894,7 @@ def vertex_edit_smooth(request):
 
     result_f32 = result.astype(np.float32)
     return JsonResponse({
-        'vertices': base64.b64encode(result_f32.tobytes()).decode('ascii'),
+        'vertices': _b64_array(result_f32),
     })
 
 
@@ -5190,7 +5908,7 @@ def vertex_edit_push_outside(request):
     Returns: {vertices (base64 Float32)} with only selected verts updated.
     """
     try:
-        body = json.loads(request.body)
+        body = _loads_json(request.body)
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON body'}, status=400)
 
@@ -5226,7 +5944,7 @@ def vertex_edit_push_outside(request):
 
     result_f32 = result.astype(np.float32)
     return JsonResponse({
-        'vertices': base64.b64encode(result_f32.tobytes()).decode('ascii'),
+        'vertices': _b64_array(result_f32),
     })
 
 
@@ -5374,7 +6092,7 @@ def retarget_merge(request):
     from humanbody_core.skeleton import SkeletonRigify
 
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON body'}, status=400)
 
@@ -5466,7 +6184,7 @@ def retarget_bvh_text(request):
     import tempfile
 
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON body'}, status=400)
 
@@ -5499,7 +6217,7 @@ def save_bvh_text(request):
     Body JSON: { path: "/abs/path/to/file.bvh", bvh_text: "HIERARCHY\\n..." }
     """
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -5533,6 +6251,8 @@ def save_bvh_text(request):
         bvh_text = bvh_text.replace('\r\n', '\n').replace('\r', '\n')
         with open(str(sp), 'w', encoding='utf-8', newline='\n') as f:
             f.write(bvh_text)
+        # Überschreiben ändert die Ordner-mtime nicht → Animationsliste neu aufbauen
+        _anims_cache['key'] = None
         return JsonResponse({'ok': True, 'path': str(sp)})
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
@@ -5571,7 +6291,7 @@ def bvh_manage(request):
     log = logging.getLogger('core')
 
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -5740,9 +6460,7 @@ def studio_audio_upload(request):
     dest_path = os.path.join(dest_dir, unique_name)
 
     try:
-        with open(dest_path, 'wb') as f:
-            for chunk in audio_file.chunks():
-                f.write(chunk)
+        _save_upload(audio_file, dest_path)
         url = f'{settings.MEDIA_URL}studio_audio/{unique_name}'
         log.info('[studio] Audio uploaded: %s (%d bytes) -> %s', audio_file.name, audio_file.size, unique_name)
         return JsonResponse({'ok': True, 'url': url})
@@ -5762,7 +6480,7 @@ def studio_project_save(request):
     log = logging.getLogger('core')
 
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -5949,9 +6667,7 @@ def studio_scene_object_upload(request):
     target_dir.mkdir(parents=True, exist_ok=True)
     fp = target_dir / fname
     try:
-        with open(fp, 'wb') as out:
-            for chunk in upload.chunks():
-                out.write(chunk)
+        _save_upload(upload, fp)
         log.info(f'[scene-object] Uploaded: {fp} ({upload.size} bytes)')
         url_path = f'{settings.MEDIA_URL}scene_objects/' + (f'{safe_bundle}/' if safe_bundle else '') + fname
         return JsonResponse({
@@ -5974,7 +6690,7 @@ def client_log(request):
     # Routet auf core.client-Logger -> client.log
     log = logging.getLogger('core.client')
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -6009,7 +6725,7 @@ def smooth_bvh(request):
     """
     log = logging.getLogger('core')
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
@@ -6146,7 +6862,7 @@ def save_bvh_effects(request):
     """
     log = logging.getLogger('core')
     try:
-        data = json.loads(request.body)
+        data = _loads_json(request.body)
     except (json.JSONDecodeError, ValueError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
 
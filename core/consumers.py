@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 
@@ -38,24 +39,24 @@ class CharacterConsumer(AsyncWebsocketConsumer):
         self._char_state = None
         self._cc_subs = {}  # {'female': CC, 'male': CC}
         self._current_gender = 'female'
+        self._fbuf = None   # reused float32 buffer for outgoing vertices
+        self._dirty = False  # state changed since the last vertex send
+        self._pending = None  # scheduled _flush task
         self._init_state()
 
     def _init_state(self):
         """Initialize CharacterState and CC subdivider lazily."""
         try:
-            from humanbody_core import MorphData, CharacterState, CharacterDefaults
-            from django.conf import settings
+            from humanbody_core import CharacterState
+            from core.character_api import (_get_cc_subdivider, _get_char_defaults,
+                                            _get_morph_data)
 
-            md = MorphData(data_dir=str(settings.HUMANBODY_DATA_DIR))
-            md.load()
-            cd = CharacterDefaults()
-            cd.load(str(settings.HUMANBODY_ROOT / 'settings.yaml'))
-
-            self._char_state = CharacterState(md, cd)
+            # Morph data and defaults are read-only and shared by all connections;
+            # only the CharacterState (morph/meta values) is per connection
+            self._char_state = CharacterState(_get_morph_data(), _get_char_defaults())
             self._char_state.set_body_type('Female_Caucasian')
 
             # Preload female CC subdivider
-            from core.character_api import _get_cc_subdivider
             self._cc_subs['female'] = _get_cc_subdivider('female')
         except Exception as e:
             logger.error("Failed to init CharacterState: %s", e)
@@ -68,15 +69,57 @@ class CharacterConsumer(AsyncWebsocketConsumer):
         return self._cc_subs.get(self._current_gender)
 
     async def disconnect(self, close_code):
+        if self._pending is not None:
+            self._pending.cancel()
         self._char_state = None
         self._cc_subs = {}
+        self._fbuf = None
+
+    def _schedule_flush(self):
+        """Mark the state dirty and make sure one _flush is scheduled."""
+        self._dirty = True
+        if self._pending is None or self._pending.done():
+            self._pending = asyncio.ensure_future(self._flush())
+
+    async def _flush(self):
+        """Recompute and send once for all changes queued since the last send.
+
+        Slider messages arriving faster than a compute are coalesced: each
+        only sets the dirty flag, the loop recomputes with the latest state.
+        """
+        await asyncio.sleep(0)  # let already-queued messages apply first
+        while self._dirty and self._char_state is not None:
+            self._dirty = False
+            try:
+                vertices = self._char_state.compute()
+                await self._send_vertices(vertices)
+            except Exception as e:
+                # Nothing awaits this task — report here instead of losing it
+                logger.exception("Live morph update failed")
+                await self.send(text_data=json.dumps({
+                    'type': 'error',
+                    'message': f'Mesh update failed: {e}',
+                }))
+                break
 
     async def _send_vertices(self, vertices):
         """Send vertices, applying CC subdivision if available."""
         cc = self._get_cc()
         if cc is not None:
-            vertices = cc.subdivide(vertices)
-        await self.send(bytes_data=vertices.astype(np.float32).tobytes())
+            # Subdivide straight into the per-connection float32 buffer
+            from core.character_api import _subdivide_into
+            vertices = _subdivide_into(cc, vertices, self._float_buffer((cc.sub_vertex_count, 3)))
+        elif vertices.dtype != np.float32 or not vertices.flags.c_contiguous:
+            # Cast into a per-connection buffer instead of a fresh array per event
+            np.copyto(self._float_buffer(vertices.shape), vertices, casting='same_kind')
+            vertices = self._fbuf
+        await self.send(bytes_data=vertices.tobytes())
+
+    def _float_buffer(self, shape):
+        """Return the reused float32 send buffer, reallocated on shape change."""
+        if self._fbuf is None or self._fbuf.shape != shape:
+            self._fbuf = np.empty(shape, dtype=np.float32)
+        return self._fbuf
 
     async def _handle_body_type(self, body_type):
         """Handle body type change, detecting gender switch."""
@@ -116,26 +159,26 @@ class CharacterConsumer(AsyncWebsocketConsumer):
         msg_type = msg.get('type')
 
         if msg_type == 'body_type':
+            # Sends its own vertices (or reload_mesh) — pending morphs are covered
+            self._dirty = False
             await self._handle_body_type(msg['value'])
 
         elif msg_type == 'morph':
             self._char_state.set_morph(msg['key'], float(msg['value']))
-            vertices = self._char_state.compute()
-            await self._send_vertices(vertices)
+            self._schedule_flush()
 
         elif msg_type == 'morph_batch':
             # Apply multiple morphs at once
             for key, val in msg.get('morphs', {}).items():
                 self._char_state.set_morph(key, float(val))
-            vertices = self._char_state.compute()
-            await self._send_vertices(vertices)
+            self._schedule_flush()
 
         elif msg_type == 'meta':
             self._char_state.set_meta(msg['name'], float(msg['value']))
-            vertices = self._char_state.compute()
-            await self._send_vertices(vertices)
+            self._schedule_flush()
 
         elif msg_type == 'reset':
+            self._dirty = False
             body_type = msg.get('body_type', 'Female_Caucasian')
             await self._handle_body_type(body_type)
             self._char_state._morph_values.clear()
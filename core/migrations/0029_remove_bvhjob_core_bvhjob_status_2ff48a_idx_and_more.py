@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0028_bvhfile_mtime_ns'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='bvhjob',
+            name='core_bvhjob_status_2ff48a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='bvhjob',
+            index=models.Index(fields=['status', '-created_at'], name='core_bvhjob_status_f63094_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bvhjob',
+            index=models.Index(fields=['-created_at'], name='core_bvhjob_created_6b676b_idx'),
+        ),
+    ]
@@ -1,6 +1,14 @@
 from django.db import models
+from django.utils.functional import cached_property
+import copy
+import json
+import re
 import uuid
 
+# "ErrorType: message" line of a traceback (any line containing "Error" and ":"
+# that is not a "File ..." frame line) — matched in one pass over the message
+_ERROR_LINE_RE = re.compile(r'^(?![^\S\n]*File )(?=[^\n]*Error)(?=[^\n]*:)([^\n]+)$', re.M)
+
 
 class BVHJob(models.Model):
     """Represents a video-to-BVH processing job."""
@@ -58,30 +66,34 @@ class BVHJob(models.Model):
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['status']),
+            # status lookups and "latest jobs with status X" share one index
+            models.Index(fields=['status', '-created_at']),
             models.Index(fields=['pipeline', '-created_at']),
+            models.Index(fields=['-created_at']),
         ]
 
     def __str__(self):
         return f"{self.name} ({self.status})"
 
-    @property
+    @cached_property
     def error_summary(self):
         """Short error description (before traceback)."""
         if not self.error_message:
             return ''
         msg = self.error_message
         # Extract the actual error type from traceback
-        if 'Traceback' in msg:
-            lines = [l for l in msg.strip().splitlines() if l.strip()]
-            prefix = msg.split('Traceback')[0].strip().rstrip(':').strip()
-            # Find last line that looks like "ErrorType: message"
-            error_line = ''
-            for line in reversed(lines):
-                s = line.strip()
-                if 'Error' in s and ':' in s and not s.startswith('File '):
-                    error_line = s
-                    break
+        head, sep, _ = msg.partition('Traceback')
+        if sep:
+            prefix = head.strip().rstrip(':').strip()
+            # Last line that looks like "ErrorType: message" — almost always
+            # the very last line, so try that slice before scanning everything
+            error_line = msg.rstrip().rpartition('\n')[2].strip()
+            if not ('Error' in error_line and ':' in error_line
+                    and not error_line.startswith('File ')):
+                m = None
+                for m in _ERROR_LINE_RE.finditer(msg):
+                    pass
+                error_line = m.group(1).strip() if m else ''
             if prefix and error_line:
                 return f"{prefix}: {error_line}"
             elif error_line:
@@ -89,17 +101,23 @@ class BVHJob(models.Model):
             elif prefix:
                 return prefix
             return 'Processing failed (traceback truncated)'
-        return msg.split('\n')[0].strip()
+        return msg.split('\n', 1)[0].strip()
 
-    @property
+    @cached_property
     def error_traceback(self):
         """Full traceback text."""
-        if not self.error_message or 'Traceback' not in self.error_message:
-            return ''
         # Everything from "Traceback" onwards
-        idx = self.error_message.find('Traceback')
+        idx = self.error_message.find('Traceback') if self.error_message else -1
+        if idx < 0:
+            return ''
         return self.error_message[idx:].strip()
 
+    def refresh_from_db(self, *args, **kwargs):
+        # error_message may have changed — drop the parsed summaries
+        self.__dict__.pop('error_summary', None)
+        self.__dict__.pop('error_traceback', None)
+        super().refresh_from_db(*args, **kwargs)
+
 
 class PhotoAnalysisJob(models.Model):
     """Stores results of a photo-to-3D analysis."""
@@ -371,12 +389,41 @@ class AppSettings(models.Model):
     def __str__(self):
         return "App Settings"
 
+    @cached_property
+    def expanded_panels_config_list(self):
+        """expanded_panels_config parsed into a list (once per instance)."""
+        return json.loads(self.expanded_panels_config or '[]')
+
+    @cached_property
+    def expanded_panels_scene_list(self):
+        """expanded_panels_scene parsed into a list (once per instance)."""
+        return json.loads(self.expanded_panels_scene or '[]')
+
+    # Process-local copy of the singleton row; dropped on save()/delete()
+    _cached = None
+
     def save(self, *args, **kwargs):
         # Enforce singleton: always use pk=1
         self.pk = 1
         super().save(*args, **kwargs)
+        type(self)._cached = None
+
+    def delete(self, *args, **kwargs):
+        type(self)._cached = None
+        return super().delete(*args, **kwargs)
 
     @classmethod
     def load(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
+        """Return the settings row, cached after the first query.
+
+        Callers get their own copy, so mutating it (e.g. ui_prefs) without
+        saving doesn't leak into the cache. All fields but the JSON ones are
+        immutable values, so only those need a deep copy.
+        """
+        if cls._cached is None:
+            cls._cached, _ = cls.objects.get_or_create(pk=1)
+        obj = copy.copy(cls._cached)  # Model.__reduce__ also copies _state
+        for f in cls._meta.concrete_fields:
+            if isinstance(f, models.JSONField):
+                obj.__dict__[f.attname] = copy.deepcopy(obj.__dict__[f.attname])
         return obj
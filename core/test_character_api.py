@@ -9,12 +9,15 @@ import json
 import logging
 import os
 import sys
-import base64
+import threading
 
 import numpy as np
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_GET
 
+from core.character_api import (_b64_array, _dumps_json, _fast_json_response,
+                                _load_json_file, _pack_mesh_arrays)
+
 logger = logging.getLogger(__name__)
 
 TEST_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'TestCharakter')
@@ -26,7 +29,10 @@ _test_morph_data = None
 _test_char_defaults = None
 _test_mesh_data = None
 _test_cc_subdivider = None
-_test_propagated_skin_weights = None
+_test_cc_class = None      # CatmullClarkSubdivider class of _test_module
+_test_fallback_topology = None  # (triangles, base64 fields) when there is no CC
+_test_propagated_skin_weights = None  # serialized JSON bytes
+_tls = threading.local()   # per-thread CharacterState reused by test_character_mesh
 
 
 def _load_test_module():
@@ -117,20 +123,10 @@ def _get_test_cc_subdivider():
     mesh = _get_test_mesh_data()
 
     if mesh.faces is not None and mesh.faces.ndim == 2 and mesh.faces.shape[1] == 4:
-        # CatmullClarkSubdivider may be a submodule import
-        if hasattr(mod, 'CatmullClarkSubdivider'):
-            CC = mod.CatmullClarkSubdivider
-        else:
-            cc_mod_path = os.path.join(TEST_DIR, 'humanbody_core', 'catmull_clark.py')
-            if os.path.isfile(cc_mod_path):
-                spec = importlib.util.spec_from_file_location(
-                    'humanbody_core_test.catmull_clark', cc_mod_path)
-                cc_mod = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(cc_mod)
-                CC = cc_mod.CatmullClarkSubdivider
-            else:
-                logger.error("CatmullClarkSubdivider not found in test module")
-                return None
+        CC = _get_test_cc_class(mod)
+        if CC is None:
+            logger.error("CatmullClarkSubdivider not found in test module")
+            return None
         _test_cc_subdivider = CC(
             mesh.faces,
             face_materials=mesh.face_materials,
@@ -156,6 +152,48 @@ def _get_test_cc_subdivider():
     return _test_cc_subdivider
 
 
+def _get_test_cc_class(mod):
+    """Resolve CatmullClarkSubdivider of the test module (once per module load)."""
+    global _test_cc_class
+    if _test_cc_class is not None:
+        return _test_cc_class
+    # CatmullClarkSubdivider may be a submodule import
+    CC = getattr(mod, 'CatmullClarkSubdivider', None)
+    if CC is None:
+        cc_mod_path = os.path.join(TEST_DIR, 'humanbody_core', 'catmull_clark.py')
+        spec = importlib.util.spec_from_file_location(
+            'humanbody_core_test.catmull_clark', cc_mod_path)
+        cc_mod = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(cc_mod)  # no separate isfile() stat
+        except FileNotFoundError:
+            return None
+        CC = cc_mod.CatmullClarkSubdivider
+    _test_cc_class = CC
+    return CC
+
+
+def _reset_test_singletons():
+    """Drop the loaded test module and every singleton derived from it."""
+    global _test_module, _test_morph_data, _test_char_defaults
+    global _test_mesh_data, _test_cc_subdivider, _test_cc_class
+    global _test_fallback_topology, _test_propagated_skin_weights
+
+    # Remove cached test modules from sys.modules
+    to_remove = [k for k in sys.modules if k.startswith('humanbody_core_test')]
+    for k in to_remove:
+        del sys.modules[k]
+
+    _test_module = None
+    _test_morph_data = None
+    _test_char_defaults = None
+    _test_mesh_data = None
+    _test_cc_subdivider = None
+    _test_cc_class = None
+    _test_fallback_topology = None
+    _test_propagated_skin_weights = None
+
+
 # =========================================================================
 # REST endpoints
 # =========================================================================
@@ -173,23 +211,26 @@ def _get_default_body_type():
 
 @require_GET
 def test_character_mesh(request):
-    """Return mesh data from the test version."""
+    """Return mesh data from the test version.
+
+    ``binary=1`` returns the same HBA1 blob as character_mesh_bin
+    (``application/octet-stream``, no base64) instead of JSON.
+    """
     default_bt = _get_default_body_type()
     body_type = request.GET.get('body_type', default_bt)
+    binary = request.GET.get('binary') in ('1', 'true')
 
     mod = _load_test_module()
     md = _get_test_morph_data()
     cd = _get_test_char_defaults()
     mesh = _get_test_mesh_data()
 
-    state = mod.CharacterState(md, cd)
-    state.set_body_type(body_type)
+    state = _test_character_state(mod, md, cd, body_type)
 
-    for key, val in request.GET.items():
-        if key.startswith('morph_'):
-            morph_name = key[len('morph_'):]
+    for key, vals in request.GET.lists():
+        if key[:6] == 'morph_' and vals:
             try:
-                state.set_morph(morph_name, float(val))
+                state.set_morph(key[6:], float(vals[-1]))
             except ValueError:
                 pass
 
@@ -202,29 +243,68 @@ def test_character_mesh(request):
     if cc is not None:
         sub_verts = cc.subdivide(vertices)
         normals = cc.compute_quad_normals(sub_verts)
+        if binary:
+            return _test_mesh_bin_response(sub_verts, normals, cc.triangles, cc.uvs,
+                                           cc.groups, mesh.material_names)
         result = {
             'vertex_count': int(sub_verts.shape[0]),
-            'vertices': base64.b64encode(
-                sub_verts.astype(np.float32).tobytes()).decode('ascii'),
-            'normals': base64.b64encode(
-                normals.ravel().astype(np.float32).tobytes()).decode('ascii'),
+            'vertices': _b64_array(sub_verts, np.float32),
+            'normals': _b64_array(normals, np.float32),
             'face_count': int(len(cc.triangles)),
-            'faces': base64.b64encode(
-                cc.triangles.ravel().astype(np.uint32).tobytes()).decode('ascii'),
+            'faces': _b64_array(cc.triangles, np.uint32),
             'groups': cc.groups,
             'material_names': mesh.material_names or [],
         }
         if cc.uvs is not None:
-            result['uvs'] = base64.b64encode(
-                cc.uvs.ravel().astype(np.float32).tobytes()).decode('ascii')
-        return JsonResponse(result)
+            result['uvs'] = _b64_array(cc.uvs, np.float32)
+        return _fast_json_response(result)
 
     # Fallback: no CC
+    triangles, topology = _get_test_fallback_topology(mesh)
+    if binary:
+        return _test_mesh_bin_response(vertices, None, triangles, mesh.uvs,
+                                       None, mesh.material_names)
+
     result = {
         'vertex_count': int(vertices.shape[0]),
-        'vertices': base64.b64encode(
-            vertices.astype(np.float32).tobytes()).decode('ascii'),
+        'vertices': _b64_array(vertices, np.float32),
     }
+    result.update(topology)
+    return _fast_json_response(result)
+
+
+def _test_character_state(mod, md, cd, body_type):
+    """CharacterState set to ``body_type`` with no morphs, reused per thread.
+
+    The thread's previous state is cleared and reused when it was built from
+    the same (still loaded) morph data and exposes its value dicts, like the
+    live consumer's reset; otherwise a new one is constructed.
+    """
+    state = getattr(_tls, 'state', None)
+    if (state is None or _tls.morph_data is not md or _tls.char_defaults is not cd
+            or not isinstance(getattr(state, '_morph_values', None), dict)
+            or not isinstance(getattr(state, '_meta_values', None), dict)):
+        state = mod.CharacterState(md, cd)
+        _tls.state, _tls.morph_data, _tls.char_defaults = state, md, cd
+    else:
+        state._morph_values.clear()
+        state._meta_values.clear()
+    state.set_body_type(body_type)
+    return state
+
+
+def _get_test_fallback_topology(mesh):
+    """Triangulated base faces plus their base64 JSON fields (CC-less fallback).
+
+    Faces and UVs never change for a loaded mesh, so this is computed once.
+    Returns (triangles or None, dict with face_count/faces/uvs as available).
+    """
+    global _test_fallback_topology
+    if _test_fallback_topology is not None:
+        return _test_fallback_topology
+
+    triangles = None
+    topology = {}
     if mesh.faces is not None:
         faces = mesh.faces
         if faces.ndim == 2 and faces.shape[1] == 4:
@@ -233,13 +313,19 @@ def test_character_mesh(request):
             triangles = np.concatenate([tri1, tri2], axis=0)
         else:
             triangles = faces[:, [0, 2, 1]] if faces.shape[1] == 3 else faces
-        result['face_count'] = int(triangles.shape[0])
-        result['faces'] = base64.b64encode(
-            triangles.ravel().astype(np.uint32).tobytes()).decode('ascii')
+        topology['face_count'] = int(triangles.shape[0])
+        topology['faces'] = _b64_array(triangles, np.uint32)
     if mesh.uvs is not None:
-        result['uvs'] = base64.b64encode(
-            mesh.uvs.ravel().astype(np.float32).tobytes()).decode('ascii')
-    return JsonResponse(result)
+        topology['uvs'] = _b64_array(mesh.uvs, np.float32)
+    _test_fallback_topology = (triangles, topology)
+    return _test_fallback_topology
+
+
+def _test_mesh_bin_response(vertices, normals, triangles, uvs, groups, mat_names):
+    """test_character_mesh arrays in the character_mesh_bin (HBA1) layout."""
+    data = _pack_mesh_arrays(vertices, normals, triangles, uvs,
+                             {'groups': groups or [], 'material_names': mat_names or []})
+    return HttpResponse(data, content_type='application/octet-stream')
 
 
 @require_GET
@@ -254,12 +340,6 @@ def test_character_morphs(request):
     state.set_body_type(default_bt)
 
     morphs = state.get_morph_list()
-    categories = {}
-    for m in morphs:
-        cat = m['category']
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(m)
 
     meta_sliders = {}
     meta_labels = {'age': 'Age', 'mass': 'Mass (kg)', 'tone': 'Tone', 'height': 'Height (cm)'}
@@ -274,10 +354,10 @@ def test_character_morphs(request):
     # Use actual L1 keys (CharMorphPlugin has 'Caucasian', humanbody_core has 'Male_Caucasian')
     body_types = sorted(md.l1.keys())
 
-    return JsonResponse({
+    return _fast_json_response({
         'body_types': body_types,
         'morphs': morphs,
-        'categories': sorted(categories.keys()),
+        'categories': sorted({m['category'] for m in morphs}),
         'skin_colors': mod.MorphData.SKIN_COLORS,
         'meta_sliders': meta_sliders,
     })
@@ -288,27 +368,25 @@ def test_character_skin_weights(request):
     """Return skin weights from the test version's data."""
     global _test_propagated_skin_weights
     if _test_propagated_skin_weights is not None:
-        return JsonResponse(_test_propagated_skin_weights)
+        return HttpResponse(_test_propagated_skin_weights, content_type='application/json')
 
     base_path = os.path.join(_get_test_data_dir(), 'skin_weights_base.json')
     if os.path.isfile(base_path):
         cc = _get_test_cc_subdivider()
         if cc is not None:
-            with open(base_path, 'r', encoding='utf-8') as f:
-                base_data = json.load(f)
+            base_data = _load_json_file(base_path)
             logger.info("Test: propagating skin weights: %d base -> %d sub",
                          base_data['vertex_count'], cc.sub_vertex_count)
-            _test_propagated_skin_weights = cc.propagate_skin_weights(
-                base_data['weights'], base_data['bone_names'])
-            return JsonResponse(_test_propagated_skin_weights)
+            # Kept serialized — the payload is only ever sent, never read back
+            _test_propagated_skin_weights = _dumps_json(cc.propagate_skin_weights(
+                base_data['weights'], base_data['bone_names']))
+            return HttpResponse(_test_propagated_skin_weights, content_type='application/json')
 
     # Fallback: raw skin_weights.json
     sw_path = os.path.join(_get_test_data_dir(), 'skin_weights.json')
     if not os.path.isfile(sw_path):
         return JsonResponse({'error': 'Skin weights not found'}, status=404)
-    with open(sw_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return JsonResponse(data)
+    return _fast_json_response(_load_json_file(sw_path))
 
 
 @require_GET
@@ -317,9 +395,7 @@ def test_character_rigify_skeleton(request):
     skel_path = os.path.join(_get_test_data_dir(), 'def_skeleton.json')
     if not os.path.isfile(skel_path):
         return JsonResponse({'error': 'DEF skeleton not exported yet'}, status=404)
-    with open(skel_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return JsonResponse(data)
+    return _fast_json_response(_load_json_file(skel_path))
 
 
 @require_GET
@@ -361,7 +437,8 @@ def test_character_source(request):
                 fpath = os.path.join(l1_dir, fname)
                 size = os.path.getsize(fpath)
                 try:
-                    arr = np.load(fpath)
+                    # mmap: only the header is needed for shape/dtype
+                    arr = np.load(fpath, mmap_mode='r')
                     l1_info.append({
                         'name': fname[:-4],
                         'file': fname,
@@ -383,7 +460,7 @@ def test_character_source(request):
     gpath = os.path.join(data_dir, 'morphs', 'gender_male.npy')
     if os.path.isfile(gpath):
         try:
-            arr = np.load(gpath)
+            arr = np.load(gpath, mmap_mode='r')
             gender_info = {
                 'file': 'gender_male.npy',
                 'size_bytes': os.path.getsize(gpath),
@@ -435,7 +512,7 @@ def test_character_source(request):
                 except Exception as e:
                     charmorph_files.append({'name': fname, 'content': f'# Error: {e}'})
 
-    return JsonResponse({
+    return _fast_json_response({
         'files': files,
         'charmorph_files': charmorph_files,
         'data_diagnostics': {
@@ -450,21 +527,7 @@ def test_character_source(request):
 @require_GET
 def test_reload(request):
     """Reset all test singletons for version switching without server restart."""
-    global _test_module, _test_morph_data, _test_char_defaults
-    global _test_mesh_data, _test_cc_subdivider, _test_propagated_skin_weights
-
-    # Remove cached test modules from sys.modules
-    to_remove = [k for k in sys.modules if k.startswith('humanbody_core_test')]
-    for k in to_remove:
-        del sys.modules[k]
-
-    _test_module = None
-    _test_morph_data = None
-    _test_char_defaults = None
-    _test_mesh_data = None
-    _test_cc_subdivider = None
-    _test_propagated_skin_weights = None
-
+    _reset_test_singletons()
     logger.info("Test character singletons reset")
     return JsonResponse({'ok': True, 'message': 'Test singletons reloaded'})
 
@@ -522,19 +585,7 @@ def test_switch_character(request):
             json.dump(info, f, indent=2, ensure_ascii=False)
 
     # Reset all singletons (same as test_reload)
-    global _test_module, _test_morph_data, _test_char_defaults
-    global _test_mesh_data, _test_cc_subdivider, _test_propagated_skin_weights
-
-    to_remove = [k for k in sys.modules if k.startswith('humanbody_core_test')]
-    for k in to_remove:
-        del sys.modules[k]
-
-    _test_module = None
-    _test_morph_data = None
-    _test_char_defaults = None
-    _test_mesh_data = None
-    _test_cc_subdivider = None
-    _test_propagated_skin_weights = None
+    _reset_test_singletons()
 
     logger.info("Switched test character to %s", name)
     return JsonResponse({
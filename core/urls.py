@@ -81,6 +81,7 @@ urlpatterns = [
     path('humanbody/test-animation/', character_api.test_animation_page, name='test_animation'),
     path('humanbody/test-character/', character_api.test_character_page, name='test_character'),
     path('api/character/mesh/', character_api.character_mesh, name='character_mesh'),
+    path('api/character/mesh-bin/', character_api.character_mesh_bin, name='character_mesh_bin'),
     path('api/character/morphs/', character_api.character_morphs, name='character_morphs'),
     path('api/character/rig/', character_api.character_rig, name='character_rig'),
     path('api/character/rigify-skeleton/', character_api.character_rigify_skeleton, name='character_rigify_skeleton'),
@@ -116,7 +116,7 @@ def dashboard(request):
 def test_mocapnet(request):
     """MocapNET system status and recent jobs."""
     status = _check_system_status()
-    recent_jobs = BVHJob.objects.all()[:10]
+    recent_jobs = BVHJob.objects.defer('error_message')[:10]
     bvh_count = BVHFile.objects.count()
 
     return render(request, 'test_mocapnet.html', {
@@ -250,7 +250,9 @@ def upload_video(request):
     s = AppSettings.load()
     default_2d = s.detector_2d_default if s.detector_2d_default in VALID_2D else 'mediapipe'
 
-    v21_jobs = BVHJob.objects.filter(pipeline__in=list(VALID_2D)).order_by('-created_at')
+    # Listings never show the (possibly long) traceback text
+    v21_jobs = (BVHJob.objects.filter(pipeline__in=list(VALID_2D))
+                .defer('error_message').order_by('-created_at'))
     _annotate_file_sizes(v21_jobs)
     return render(request, 'upload.html', {
         'status': status, 'v21_jobs': v21_jobs, 'default_2d': default_2d,
@@ -410,7 +412,8 @@ def upload_video_v4(request):
         'hybrid_v4_mp_tracking': s.mp_min_tracking_confidence,
     }
 
-    v4_jobs = BVHJob.objects.filter(pipeline__in=list(VALID_3D)).order_by('-created_at')
+    v4_jobs = (BVHJob.objects.filter(pipeline__in=list(VALID_3D))
+               .defer('error_message').order_by('-created_at'))
     _annotate_file_sizes(v4_jobs)
 
     # Collect ALL video files — always use absolute paths.
@@ -2025,7 +2028,8 @@ def job_result(request, job_id):
 
 def standalone_result(request):
     """Standalone result page with job dropdown selector."""
-    completed_jobs = BVHJob.objects.filter(status='complete').order_by('-created_at')
+    completed_jobs = (BVHJob.objects.filter(status='complete')
+                      .defer('error_message').order_by('-created_at'))
     job = None
     job_id = request.GET.get('job')
     if job_id:
@@ -2427,7 +2431,7 @@ print("BVH loaded:", {safe_name})
 
 def processed_list(request):
     """List all completed jobs with thumbnails."""
-    jobs = BVHJob.objects.filter(status='complete')
+    jobs = BVHJob.objects.filter(status='complete').defer('error_message')
     # Add bvh_basename as an annotation for the template
     for job in jobs:
         job.bvh_basename = os.path.basename(job.bvh_file) if job.bvh_file else '—'
@@ -3150,7 +3154,7 @@ from django.views.decorators.csrf import csrf_exempt as _csrf_exempt
 def ui_prefs_api(request):
     """GET/POST UI preferences (panel sizes etc.)."""
     from .models import AppSettings
-    settings_obj, _ = AppSettings.objects.get_or_create(pk=1)
+    settings_obj = AppSettings.load()
     if request.method == 'POST':
         data = json.loads(request.body)
         prefs = settings_obj.ui_prefs or {}
@@ -1,5 +1,68 @@
 """Tests für Character-API Endpoints."""
-from .base import TestCategory, http_request
+import base64
+import json
+import struct
+import urllib.request
+
+import numpy as np
+
+from .base import BASE_URL, TestCategory, http_request
+
+
+_MESH_QUERY = '/api/character/mesh/?body_type=Female_Caucasian'
+
+
+def _fetch_raw(path, data=None, timeout=15):
+    """GET (oder POST mit JSON-Body) → (status, rohe Bytes)."""
+    if data is None:
+        req = urllib.request.Request(BASE_URL + path)
+    else:
+        req = urllib.request.Request(BASE_URL + path, data=json.dumps(data).encode(),
+                                     method='POST')
+        req.add_header('Content-Type', 'application/json')
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.status, resp.read()
+
+
+def _b64(text, dtype):
+    """Base64-Feld einer JSON-Antwort → flaches numpy-Array."""
+    return np.frombuffer(base64.b64decode(text), dtype=dtype)
+
+
+def _decode_hba1(blob):
+    """HBA1-Blob (character_api._pack_arrays) → (Header-Dict, {name: Array}).
+
+    Prüft Magic, Header-Länge, 8-Byte-Alignment und dass jede Section
+    vollständig im Blob liegt; wirft AssertionError sonst.
+    """
+    assert blob[:4] == b'HBA1', f'Magic {blob[:4]!r}'
+    (head_len,) = struct.unpack_from('<I', blob, 4)
+    assert 8 + head_len <= len(blob), f'Header-Länge {head_len} > Blob'
+    head = json.loads(blob[8:8 + head_len].decode('utf-8'))
+    start = (8 + head_len + 7) & ~7
+    arrays = {}
+    for sec in head['sections']:
+        dtype = np.dtype(sec['dtype']).newbyteorder('<')
+        count = int(np.prod(sec['shape']))
+        off = start + sec['offset']
+        assert sec['offset'] % 8 == 0, f"{sec['name']}: Offset nicht 8-Byte-aligned"
+        assert off + count * dtype.itemsize <= len(blob), f"{sec['name']}: Section abgeschnitten"
+        arrays[sec['name']] = np.frombuffer(blob, dtype=dtype, count=count,
+                                            offset=off).reshape(sec['shape'])
+    return head, arrays
+
+
+def _oct_decode(packed):
+    """Octahedral-snorm16-Paare (normal_format 'oct16') → (N,3) Einheitsnormalen."""
+    p = packed.reshape(-1, 2).astype(np.float64) / 32767.0
+    x, y = p[:, 0], p[:, 1]
+    z = 1.0 - np.abs(x) - np.abs(y)
+    neg = z < 0
+    sx, sy = np.where(x >= 0, 1.0, -1.0), np.where(y >= 0, 1.0, -1.0)
+    x, y = (np.where(neg, (1.0 - np.abs(y)) * sx, x),
+            np.where(neg, (1.0 - np.abs(x)) * sy, y))
+    n = np.stack([x, y, z], axis=1)
+    return n / np.linalg.norm(n, axis=1, keepdims=True)
 
 
 class CharacterApiTests(TestCategory):
@@ -36,6 +99,142 @@ class CharacterApiTests(TestCategory):
         code, _ = http_request('/api/character/mesh/?body_type=Female_Caucasian')
         return code == 200, f'HTTP {code}'
 
+    @staticmethod
+    def test_mesh_bin_endpoint():
+        """GET /api/character/mesh-bin/ → HTTP 200 + HBA1-Blob passend zur JSON-Antwort"""
+        try:
+            code, blob = _fetch_raw('/api/character/mesh-bin/?body_type=Female_Caucasian')
+            head, arrays = _decode_hba1(blob)
+        except Exception as e:
+            return False, str(e)
+        ref_code, ref = http_request(_MESH_QUERY)
+        if code != 200 or ref_code != 200:
+            return False, f'HTTP {code} / JSON {ref_code}'
+        verts = arrays.get('vertices')
+        if verts is None or verts.dtype != np.float32 or verts.shape != (ref['vertex_count'], 3):
+            return False, f'vertices {None if verts is None else (verts.dtype, verts.shape)}'
+        if 'faces' in arrays and arrays['faces'].shape[0] != ref.get('face_count'):
+            return False, f"faces {arrays['faces'].shape} ≠ face_count {ref.get('face_count')}"
+        if not np.array_equal(verts.ravel(), _b64(ref['vertices'], np.float32)):
+            return False, 'Vertices weichen von der JSON-Antwort ab'
+        return ('groups' in head and 'material_names' in head,
+                f"{verts.shape[0]} Vertices, Sections {sorted(arrays)}")
+
+    @staticmethod
+    def test_mesh_quantize_int16():
+        """GET /api/character/mesh/?quantize=1 → int16-Vertices + oct16-Normalen, Fehler ≤ halber Schritt"""
+        code, q = http_request(_MESH_QUERY + '&quantize=1')
+        ref_code, ref = http_request(_MESH_QUERY)
+        if code != 200 or ref_code != 200:
+            return False, f'HTTP {code} / Referenz {ref_code}'
+        if q.get('vertex_format') != 'int16':
+            return False, f"vertex_format {q.get('vertex_format')!r}"
+        n = ref['vertex_count']
+        verts16 = _b64(q['vertices'], np.int16)
+        if q['vertex_count'] != n or verts16.size != n * 3:
+            return False, f'{verts16.size} int16-Werte für {n} Vertices'
+        scale, center = q['vertex_scale'], np.asarray(q['vertex_center'])
+        decoded = verts16.reshape(-1, 3) * scale + center
+        err = float(np.abs(decoded - _b64(ref['vertices'], np.float32).reshape(-1, 3)).max())
+        if err > scale * 0.5 + 1e-5:
+            return False, f'Positionsfehler {err:.3g} > halber Schritt {scale * 0.5:.3g}'
+        if 'normals' not in ref:
+            return True, f'max. Fehler {err:.3g} (keine Normalen)'
+        if q.get('normal_format') != 'oct16':
+            return False, f"normal_format {q.get('normal_format')!r}"
+        packed = _b64(q['normals'], np.int16)
+        if packed.size != n * 2:
+            return False, f'{packed.size} oct16-Werte für {n} Normalen'
+        ref_n = _b64(ref['normals'], np.float32).reshape(-1, 3).astype(np.float64)
+        ref_n /= np.maximum(np.linalg.norm(ref_n, axis=1, keepdims=True), 1e-12)
+        min_dot = float((_oct_decode(packed) * ref_n).sum(axis=1).min())
+        return min_dot > 0.9999, f'max. Fehler {err:.3g}, min. Normalen-dot {min_dot:.6f}'
+
+    @staticmethod
+    def test_mesh_precision_fp16():
+        """GET /api/character/mesh/?precision=fp16 → float16-Vertices/Normalen, Rundungsfehler ≤ 2^-11"""
+        code, h = http_request(_MESH_QUERY + '&precision=fp16')
+        ref_code, ref = http_request(_MESH_QUERY)
+        if code != 200 or ref_code != 200:
+            return False, f'HTTP {code} / Referenz {ref_code}'
+        if h.get('vertex_format') != 'float16':
+            return False, f"vertex_format {h.get('vertex_format')!r}"
+        worst = 0.0
+        for key in ('vertices', 'normals'):
+            if key not in ref:
+                continue
+            if key == 'normals' and h.get('normal_format') != 'float16':
+                return False, f"normal_format {h.get('normal_format')!r}"
+            half = _b64(h[key], np.float16)
+            full = _b64(ref[key], np.float32)
+            if half.size != full.size or half.size != ref['vertex_count'] * 3:
+                return False, f'{key}: {half.size} float16-Werte, erwartet {full.size}'
+            # Round-to-nearest: relativ 2^-11, im subnormalen Bereich absolut 2^-25
+            err = np.abs(half.astype(np.float64) - full)
+            if not np.all(err <= np.abs(full) * 2.0 ** -11 + 2.0 ** -25):
+                return False, f'{key}: Rundungsfehler {float(err.max()):.3g}'
+            worst = max(worst, float(err.max()))
+        return True, f'max. Fehler {worst:.3g}'
+
+    @staticmethod
+    def test_cloth_binary():
+        """GET /api/character/cloth/?binary=1 → HBA1-Blob identisch zur JSON-Antwort"""
+        path = '/api/character/cloth/?body_type=Female_Caucasian'
+        try:
+            code, blob = _fetch_raw(path + '&binary=1')
+            head, arrays = _decode_hba1(blob)
+        except Exception as e:
+            return False, str(e)
+        ref_code, ref = http_request(path)
+        if code != 200 or ref_code != 200:
+            return False, f'HTTP {code} / JSON {ref_code}'
+        n, f = ref['vertex_count'], ref['face_count']
+        expected = {'vertices': (np.float32, (n, 3)), 'normals': (np.float32, (n, 3)),
+                    'faces': (np.uint32, (f, 3))}
+        if 'skin_indices' in ref:
+            expected['skin_indices'] = expected['skin_weights'] = (np.float32, (n, 4))
+        for name, (dtype, shape) in expected.items():
+            arr = arrays.get(name)
+            if arr is None or arr.dtype != dtype or arr.shape != shape:
+                return False, f'{name}: {None if arr is None else (arr.dtype, arr.shape)}, erwartet {shape}'
+            if not np.allclose(arr.ravel(), _b64(ref[name], dtype), atol=1e-6):
+                return False, f'{name} weicht von der JSON-Antwort ab'
+        return head.get('color') == ref['color'], f'{n} Vertices, {f} Faces'
+
+    @staticmethod
+    def test_smplx_binary():
+        """POST /api/character/smplx-mesh/?binary=1 → HBA1-Blob identisch zur JSON-Antwort"""
+        body = {'betas': [0.0] * 10, 'gender': 'neutral'}
+        ref_code, ref = http_request('/api/character/smplx-mesh/', method='POST', data=body)
+        if ref_code != 200:
+            return False, f'HTTP {ref_code}'
+        if not ref.get('ok'):
+            return True, f"Skip: {ref.get('error', 'SMPL-X nicht verfügbar')}"
+        try:
+            code, blob = _fetch_raw('/api/character/smplx-mesh/?binary=1', data=body)
+            head, arrays = _decode_hba1(blob)
+        except Exception as e:
+            return False, str(e)
+        if code != 200:
+            return False, f'HTTP {code}'
+        for key in ('n_verts', 'n_faces', 'n_joints'):
+            if head.get(key) != ref[key]:
+                return False, f'{key}: {head.get(key)} ≠ {ref[key]}'
+        if arrays['vertices'].shape[0] != ref['n_verts'] or arrays['joints'].shape[0] != ref['n_joints']:
+            return False, f"Shapes {arrays['vertices'].shape} / {arrays['joints'].shape}"
+        if arrays['parents'].tolist() != list(ref['parents']):
+            return False, 'parents weichen ab'
+        names = ['vertices', 'faces', 'joints', 'skin_indices', 'skin_weights']
+        if 'uv_coords' in ref:
+            names += ['uv_vertices', 'uv_coords', 'uv_faces', 'uv_skin_indices', 'uv_skin_weights']
+        for name in names:
+            arr = arrays.get(name)
+            if arr is None:
+                return False, f'Section {name} fehlt'
+            if not np.array_equal(arr.ravel(), _b64(ref[name], arr.dtype.newbyteorder('='))):
+                return False, f'{name} weicht von der JSON-Antwort ab'
+        return True, f"{ref['n_verts']} Vertices, {len(arrays)} Sections"
+
     @staticmethod
     def test_morphs_endpoint():
         """GET /api/character/morphs/ → HTTP 200"""
@@ -129,6 +129,13 @@ HUMANBODY_GARMENT_EXPORT_DIR = HUMANBODY_ROOT / 'data' / 'garment_exports'
 HUMANBODY_SMPL_GARMENT_DIR = HUMANBODY_ROOT / 'data' / 'garment_pattern_gen'
 SMPL_MODELS_DIR = VIDEOTOBVH_ROOT / 'models' / 'smpl'
 
+# Behind nginx: let it send GLB/BVH files via X-Accel-Redirect.
+# {directory: internal location prefix}, e.g.
+#   {HUMANBODY_ROOT / 'data': '/internal/humanbody-data/'}
+# with a matching "location /internal/humanbody-data/ { internal; alias ...; }".
+# Empty → files are streamed by Django (FileResponse).
+SENDFILE_ACCEL_ROOTS = {}
+
 # Add assetCreator to Python path for GarmentFitter
 _asset_creator_parent = str(HUMANBODY_ROOT / 'assetCreator')
 if _asset_creator_parent not in sys.path: